@@ -0,0 +1,234 @@
+from math import sqrt
+
+import numpy as np
+
+class RoundStats:
+    """
+    Running aggregates over any number of rounds, without keeping the
+    rounds: win, tie and loss counts, bust counts, Welford mean and
+    variance of the wallet change, and a fixed-bin histogram of the
+    drawdown (how far the wallet is below its highest point so far)
+    after every round.
+
+    Rounds can be added one at a time from `Blackjack.iter_rounds` or in
+    bulk from the arrays of `Simulation.play_round`. Aggregates from
+    separate runs (for example Tournament workers) combine with `merge`.
+
+    >>> from blackjack import Blackjack
+    >>> from deck import Shoe
+    >>> from os import devnull
+    >>> from summary import SummaryWriter
+    >>> from simulation import Simulation
+    >>> game = Blackjack(1000, Shoe(6), rng=3, log_level='off',\\
+    ... summary=SummaryWriter(devnull))
+    >>> one_by_one = RoundStats()
+    >>> for round_result in game.iter_rounds(300, 17):
+    ...     one_by_one.add(round_result)
+    >>> batch = RoundStats()
+    >>> batch.add_outcomes(Simulation(1000, Shoe(6), rng=3).play_round(300, 17))
+    >>> one_by_one.rounds, one_by_one.rates() == batch.rates()
+    (300, True)
+    >>> abs(one_by_one.mean - batch.mean) < 1e-9
+    True
+    >>> abs(one_by_one.variance() - batch.variance()) < 1e-9
+    True
+    >>> bool((one_by_one.drawdowns == batch.drawdowns).all())
+    True
+
+    # Two halves merged give the same moments as the whole
+    >>> outcomes = Simulation(1000, Shoe(6), rng=4).play_round(400, 16)
+    >>> whole, first, second = RoundStats(), RoundStats(), RoundStats()
+    >>> whole.add_outcomes(outcomes)
+    >>> first.add_outcomes({k: v[:150] for k, v in outcomes.items()})
+    >>> second.add_outcomes({k: v[150:] for k, v in outcomes.items()})
+    >>> first.merge(second)
+    >>> first.rounds, first.rates() == whole.rates()
+    (400, True)
+    >>> abs(first.variance() - whole.variance()) < 1e-9
+    True
+    >>> low, high = whole.ev_interval()
+    >>> low < whole.ev() < high
+    True
+    """
+
+    # Class Attribute(s)
+
+    def __init__(self, bin_width=5, num_bins=200):
+        """
+        Parameters:
+            bin_width (int): Width of each drawdown histogram bin.
+            num_bins (int): Number of bins. The last one also counts
+            every larger drawdown.
+        """
+        self.bin_width = bin_width
+        self.rounds = 0
+        self.wins = 0
+        self.ties = 0
+        self.losses = 0
+        self.player_busts = 0
+        self.dealer_busts = 0
+        # Welford moments of the wallet change per round
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.drawdowns = np.zeros(num_bins, dtype = np.int64)
+        self.max_drawdown = 0
+        # Highest wallet so far in the run being added
+        self.peak = None
+
+    def add(self, round_result):
+        """
+        Adds one RoundResult.
+        """
+        threshold = 21
+        change = round_result.result * round_result.bet
+        self.rounds += 1
+        if round_result.result == 1:
+            self.wins += 1
+        elif round_result.result == -1:
+            self.losses += 1
+        else:
+            self.ties += 1
+        self.player_busts += round_result.player_score > threshold
+        self.dealer_busts += round_result.dealer_score > threshold
+        delta = change - self.mean
+        self.mean += delta / self.rounds
+        self.m2 += delta * (change - self.mean)
+
+        wallet = round_result.wallet
+        if self.peak is None:
+            self.peak = wallet - change
+        self.peak = max(self.peak, wallet)
+        drawdown = self.peak - wallet
+        self.max_drawdown = max(self.max_drawdown, drawdown)
+        self.drawdowns[min(drawdown // self.bin_width,\
+        len(self.drawdowns) - 1)] += 1
+
+    def add_outcomes(self, outcomes):
+        """
+        Adds every round in a dictionary of arrays returned by
+        `Simulation.play_round`, as one batch.
+        """
+        threshold = 21
+        result = outcomes['result'].astype(np.int64)
+        if len(result) == 0:
+            return None
+        change = result * outcomes['bet']
+        other = RoundStats(self.bin_width, len(self.drawdowns))
+        other.rounds = len(result)
+        other.wins = int(np.count_nonzero(result == 1))
+        other.losses = int(np.count_nonzero(result == -1))
+        other.ties = other.rounds - other.wins - other.losses
+        other.player_busts = int(np.count_nonzero(\
+        outcomes['player_score'] > threshold))
+        other.dealer_busts = int(np.count_nonzero(\
+        outcomes['dealer_score'] > threshold))
+        other.mean = float(change.mean())
+        other.m2 = float(((change - other.mean) ** 2).sum())
+
+        wallet = outcomes['wallet'] + change
+        peak = outcomes['wallet'][0] if self.peak is None else self.peak
+        peaks = np.maximum(np.maximum.accumulate(wallet), peak)
+        drawdown = peaks - wallet
+        other.max_drawdown = int(drawdown.max())
+        other.drawdowns = np.bincount(np.minimum(drawdown // self.bin_width,\
+        len(self.drawdowns) - 1), minlength = len(self.drawdowns))
+        RoundStats.merge(self, other)
+        self.peak = int(peaks[-1])
+
+    def merge(self, other):
+        """
+        Adds the aggregates of `other` (with the same bins) to these,
+        combining the moments with Chan's parallel formula.
+        """
+        assert len(other.drawdowns) == len(self.drawdowns)
+        assert other.bin_width == self.bin_width
+        rounds = self.rounds + other.rounds
+        if rounds == 0:
+            return None
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta ** 2 * self.rounds * other.rounds / rounds
+        self.mean += delta * other.rounds / rounds
+        self.rounds = rounds
+        self.wins += other.wins
+        self.ties += other.ties
+        self.losses += other.losses
+        self.player_busts += other.player_busts
+        self.dealer_busts += other.dealer_busts
+        self.drawdowns = self.drawdowns + other.drawdowns
+        self.max_drawdown = max(self.max_drawdown, other.max_drawdown)
+
+    def variance(self):
+        """
+        Returns the sample variance of the wallet change per round.
+        """
+        if self.rounds < 2:
+            return 0.0
+        return self.m2 / (self.rounds - 1)
+
+    def rates(self):
+        """
+        Returns the win, tie, loss, player bust and dealer bust rates.
+        """
+        rounds = max(self.rounds, 1)
+        return {'win': self.wins / rounds, 'tie': self.ties / rounds,
+                'loss': self.losses / rounds,
+                'player_bust': self.player_busts / rounds,
+                'dealer_bust': self.dealer_busts / rounds}
+
+    def ev(self):
+        """
+        Returns the mean result per round in units of the bet, as in
+        `MonteCarlo.evaluate`.
+        """
+        return (self.wins - self.losses) / max(self.rounds, 1)
+
+    def ev_interval(self, z=1.96):
+        """
+        Returns the normal confidence interval of `ev` (95% by default).
+        """
+        ev = RoundStats.ev(self)
+        if self.rounds < 2:
+            return (-1.0, 1.0)
+        variance = (self.wins + self.losses) / self.rounds - ev ** 2
+        half = z * sqrt(variance / (self.rounds - 1))
+        return (ev - half, ev + half)
+
+    def converged(self, width, z=1.96, min_rounds=1000):
+        """
+        Returns whether at least `min_rounds` were added and the
+        confidence interval of `ev` is at most `width` wide.
+        """
+        if self.rounds < min_rounds:
+            return False
+        low, high = RoundStats.ev_interval(self, z)
+        return high - low <= width
+
+    def run(game, stand_threshold, width, max_rounds, check_every=1000,
+            z=1.96):
+        """
+        Plays up to `max_rounds` rounds of `game` through `iter_rounds`,
+        stopping early once the confidence interval of `ev` is at most
+        `width` wide. Returns the RoundStats.
+
+        >>> from blackjack import Blackjack
+        >>> from deck import Shoe
+        >>> from os import devnull
+        >>> from summary import SummaryWriter
+        >>> game = Blackjack(10 ** 9, Shoe(6), rng=1, log_level='off',\\
+        ... summary=SummaryWriter(devnull))
+        >>> stats = RoundStats.run(game, 17, 0.1, 10 ** 6)
+        >>> stats.rounds
+        2000
+        >>> low, high = stats.ev_interval()
+        >>> high - low <= 0.1
+        True
+        """
+        stats = RoundStats()
+        rounds = game.iter_rounds(max_rounds, stand_threshold)
+        for round_result in rounds:
+            stats.add(round_result)
+            if (stats.rounds % check_every == 0) and \
+            RoundStats.converged(stats, width, z):
+                rounds.close()
+                break
+        return stats
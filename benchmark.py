@@ -0,0 +1,161 @@
+import json
+import platform
+import sys
+from os import devnull, path
+from tempfile import TemporaryDirectory
+from time import strftime
+from timeit import Timer
+
+from blackjack import Blackjack
+from deck import Deck, Shoe
+from hand import PlayerHand
+from shuffle import Shuffle
+from summary import SummaryWriter
+
+class Benchmark:
+    """
+    Timing harness for the hot paths, built on `timeit`. Every case is
+    timed `repeat` times and the fastest run is kept. Results are plain
+    dictionaries that `to_json` turns into text, so runs from two commits
+    can be saved and passed to `compare`.
+
+    Run every case and write the JSON report with:
+
+        python benchmark.py [report.json]
+
+    >>> results = Benchmark.run(['calculate_score', 'mongean_52'],
+    ...                         repeat = 1, min_time = 0.001)
+    >>> sorted(results['cases'])
+    ['calculate_score', 'mongean_52']
+    >>> case = results['cases']['mongean_52']
+    >>> case['unit'], case['per_second'] > 0
+    ('shuffle', True)
+    >>> report = json.loads(Benchmark.to_json(results))
+    >>> report['cases']['calculate_score']['unit']
+    'score'
+    >>> Benchmark.compare(report, report)
+    {'calculate_score': 1.0, 'mongean_52': 1.0}
+    """
+
+    # Class Attribute(s)
+    # Maps each case to the name of what one operation is
+    units = {'card_sort': 'sort of 52 cards',
+             'hand_add_card': 'card',
+             'calculate_score': 'score',
+             'deck_deal': 'card',
+             'mongean_52': 'shuffle',
+             'mongean_416': 'shuffle',
+             'modified_overhand_52': 'shuffle',
+             'modified_overhand_416': 'shuffle',
+             'play_round': 'round',
+             'play_round_file': 'round'}
+    # Rounds played by each call of the play_round cases
+    rounds = 100
+
+    def case(name, folder):
+        """
+        Returns (function to time, operations per call) for the case
+        `name`. Files are written inside `folder`.
+        """
+        deck = Deck()
+        deck.shuffle(mongean = 3, modified_overhand = 4)
+        cards = deck.get_cards()
+        if name == 'card_sort':
+            return lambda: sorted(cards), 1
+        elif name == 'hand_add_card':
+            def add_cards():
+                hand = PlayerHand()
+                for card in cards[:8]:
+                    hand.add_card(card)
+            return add_cards, 8
+        elif name == 'calculate_score':
+            hand = PlayerHand()
+            hand.add_card(*cards[:3])
+            return lambda: Blackjack.calculate_score(hand), 1
+        elif name == 'deck_deal':
+            def deal_deck():
+                deck.top = 0
+                for i in range(13):
+                    hand = PlayerHand()
+                    deck.deal_hand(hand)
+                    deck.deal_hand(hand)
+                    deck.deal_hand(hand)
+                    deck.deal_hand(hand)
+            return deal_deck, 52
+        elif name.startswith('mongean_'):
+            codes = list(range(int(name.split('_')[-1])))
+            return lambda: Shuffle.mongean(codes), 1
+        elif name.startswith('modified_overhand_'):
+            codes = list(range(int(name.split('_')[-1])))
+            max_count = 5
+            return lambda: Shuffle.modified_overhand(codes, max_count), 1
+        elif name == 'play_round':
+            # The whole of Blackjack.play_round, with the summary going to
+            # os.devnull instead of a file
+            game = Blackjack(10 ** 12, Shoe(8), rng = 0,\
+            summary = SummaryWriter(devnull))
+            def play_rounds():
+                game.play_round(Benchmark.rounds, 17)
+                game.reset_log()
+            return play_rounds, Benchmark.rounds
+        elif name == 'play_round_file':
+            game = Blackjack(10 ** 12, Shoe(8), rng = 0)
+            game.summary = SummaryWriter(path.join(folder, 'summary.txt'))
+            def play_rounds():
+                game.play_round(Benchmark.rounds, 17)
+                game.reset_log()
+            return play_rounds, Benchmark.rounds
+        raise KeyError(name)
+
+    def time(function, operations, repeat=5, min_time=0.2):
+        """
+        Times `function`, calling it often enough per run to take at least
+        `min_time` seconds, and returns the fastest run per operation.
+        """
+        timer = Timer(function)
+        number = 1
+        while timer.timeit(number) < min_time:
+            number *= 2
+        best = min(timer.repeat(repeat, number)) / (number * operations)
+        return {'seconds': best, 'per_second': 1 / best, 'calls': number,
+                'repeat': repeat}
+
+    def run(names=None, repeat=5, min_time=0.2):
+        """
+        Times every case in `names` (all of them by default) and returns
+        the results with a description of the machine.
+        """
+        if names is None:
+            names = list(Benchmark.units)
+        cases = {}
+        with TemporaryDirectory() as folder:
+            for name in names:
+                function, operations = Benchmark.case(name, folder)
+                cases[name] = Benchmark.time(function, operations, repeat,\
+                min_time)
+                cases[name]['unit'] = Benchmark.units[name]
+        return {'python': platform.python_version(),
+                'machine': platform.platform(),
+                'time': strftime('%Y-%m-%dT%H:%M:%S'),
+                'cases': cases}
+
+    def to_json(results):
+        return json.dumps(results, indent = 2, sort_keys = True)
+
+    def compare(before, after):
+        """
+        Returns the speedup of every case found in both results: above 1
+        when `after` is faster than `before`.
+        """
+        return {name: round(before['cases'][name]['seconds'] /\
+        after['cases'][name]['seconds'], 3) for name in after['cases']\
+        if name in before['cases']}
+
+
+if __name__ == '__main__':
+    report = Benchmark.to_json(Benchmark.run())
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'w', encoding = 'utf-8') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
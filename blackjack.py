@@ -1,6 +1,16 @@
-from deck import Deck
+from deck import Deck, Shoe
 from hand import DealerHand, PlayerHand
 from card import Card
+from summary import NullWriter, SummaryWriter
+from events import EventLog
+from result import RoundResult
+from strategy import Strategy, ThresholdStrategy
+from counter import CardCounter
+from records import RecordWriter
+from time import perf_counter_ns
+from os import path, replace
+import json
+import numpy as np
 
 # don't change these imports
 from numpy.random import randint, seed
@@ -13,7 +23,8 @@ class Blackjack:
     # Removes the game summaries from the previous doctest run
     >>> from os import remove, listdir
     >>> for f in listdir("game_summaries"):
-    ...    remove("game_summaries/" + f)
+    ...    if f.endswith(".txt"):
+    ...        remove("game_summaries/" + f)
 
     #######################################
     ### Doctests for calculate_score() ####
@@ -170,22 +181,138 @@ class Blackjack:
     >>> blackjack_4.play_round(1, 17)
     >>> print(blackjack_4.get_log())
     Not enough cards for a game.
+
+    #######################################
+    ### Doctests for rng ##################
+    #######################################
+    >>> table_1 = Blackjack(100, rng=7)
+    >>> table_2 = Blackjack(100, rng=np.random.default_rng(7))
+    >>> table_1.play_round(2, 17)
+    >>> table_2.play_round(1, 17)
+    >>> table_2.play_round(1, 17)
+    >>> table_1.get_log() == table_2.get_log()
+    True
+    >>> table_1.predraw_shuffles(2000)
+    >>> len(table_1.shuffle_buffer) - table_1.shuffle_index >= 2000
+    True
+
+    #######################################
+    ### Doctests for log_level ############
+    #######################################
+    >>> quiet = Blackjack(100, rng=7, log_level='rounds')
+    >>> quiet.play_round(1, 17)
+    >>> print(quiet.get_log())
+    Round 1 of Blackjack!
+    wallet: 100
+    bet: 5
+    Player and Dealer tie.
+    <BLANKLINE>
+
+    #######################################
+    ### Doctests for counter ##############
+    #######################################
+    >>> from counter import CardCounter
+    >>> counted = Blackjack(1000, Shoe(6), rng=2, log_level='rounds',\\
+    ... counter=CardCounter(spread=4))
+    >>> counted.play_round(200, 17)
+    >>> bets = [int(line[5:]) for line in counted.get_log().split('\\n')\\
+    ... if line.startswith('bet: ')]
+    >>> sorted(set(bets))
+    [5, 10, 15, 20]
+
+    #######################################
+    ### Doctests for checkpoints ##########
+    #######################################
+    >>> from tempfile import TemporaryDirectory
+    >>> folder = TemporaryDirectory()
+    >>> saved = folder.name + "/session.json"
+    >>> writer = SummaryWriter(folder.name + "/summary.txt")
+    >>> session = Blackjack(100, Shoe(2), rng=5, summary=writer,\\
+    ... counter=CardCounter())
+    >>> session.checkpoint(saved, 10)
+    >>> session.play_round(25, 16)
+    >>> writer.close()
+    >>> summary = open(writer.path, encoding = 'utf-8').read()
+
+    # The job dies after round 25; the last checkpoint was after round 20
+    >>> resumed = Blackjack.resume(saved)
+    >>> resumed.summary.close()
+    >>> resumed.get_log() == session.get_log()
+    True
+    >>> (resumed.wallet, resumed.min_bet, resumed.rounds) == \\
+    ... (session.wallet, session.min_bet, session.rounds)
+    True
+    >>> resumed.counter.state() == session.counter.state()
+    True
+    >>> open(writer.path, encoding = 'utf-8').read() == summary
+    True
+
+    # The log is appended to a file next to the checkpoint, so checkpoints
+    # stay the same size however many rounds have been played
+    >>> from os import path
+    >>> path.exists(saved + ".log"), path.getsize(saved) < 2000
+    (True, True)
+    >>> folder.cleanup()
     """
     # Class Attribute(s)
+    # Number of rounds of shuffle counts drawn at a time from `rng`
+    shuffle_block = 256
+    # The dealer hits while under 17
+    dealer_strategy = ThresholdStrategy(17)
 
-    def __init__(self, wallet):
+    def __init__(self, wallet, deck=None, rng=None, summary=None,
+                 log_level='cards', counter=None, instruments=None):
         # Initialize instance attributes
         # auto-increment as needed
+        # `deck` can be a Shoe to play long sessions without running out.
+        # `rng` is a numpy Generator or a seed for one, used for every
+        # shuffle count. Without it the global numpy random state is used.
+        # `summary` is a SummaryWriter to keep open across play_round calls;
+        # by default each call opens and closes its own.
+        # `log_level` is one of EventLog.levels; 'rounds' skips the
+        # per-card events for high-volume runs.
+        # `counter` is a CardCounter tracking the deck; when given, each
+        # round's bet comes from its true count instead of the +/-5
+        # progression.
+        # `instruments` is an Instruments instance that times each phase
+        # of play_round (see `stats`). Without it nothing is timed.
         self.wallet = wallet
-        self.deck = Deck()
-        self.log = ""
+        if deck is None:
+            deck = Deck()
+        self.deck = deck
+        if (rng is not None) and (not isinstance(rng, np.random.Generator)):
+            rng = np.random.default_rng(rng)
+        self.rng = rng
+        self.shuffle_buffer = []
+        self.shuffle_index = 0
+        self.summary = summary
+        self.log = EventLog(log_level)
+        self.counter = counter
+        if counter is not None:
+            self.deck.track(counter)
+        self.checkpoint_path = None
+        self.checkpoint_every = 0
+        # (path, number of log events) last written by `save_log`
+        self.log_saved = None
+        # Why the last round could not be played, see `start_round`
+        self.status = 'completed'
+        # perf_counter_ns at the start of the round and of its hits
+        self.round_started = 0
+        self.hits_started = 0
+        self.instruments = instruments
+        if instruments is not None:
+            instruments.wrap(self.deck, 'shuffle', 'shuffle', 'shuffles')
+            instruments.wrap(self.deck, 'deal_hand', 'deal', 'cards_dealt')
+            instruments.wrap(self.log, 'add', 'log')
         self.game_number = 0
         self.rounds = 1
         self.min_bet = 5
+        # Bet played in the current round, which settling it moves
+        self.bet = 5
         self.player_hand = PlayerHand()
         self.dealer_hand = DealerHand()
 
-    def play_round(self, num_rounds, stand_threshold):
+    def play_round(self, num_rounds, stand_threshold, resume=False):
         """
         Plays `num_rounds` Blackjack rounds.
 
@@ -193,73 +320,208 @@ class Blackjack:
             num_rounds (int): Number of rounds to play.
             stand_threshold (int): Score threshold for when the player
             will stand (ie player stands if they have a score >=
-            this threshold)
+            this threshold). A Strategy can be passed instead.
+            resume (bool): Keep the current bet instead of starting
+            again from 5, to carry on a session restored by `restore`.
+        """
+        for round_result in Blackjack.iter_rounds(self, num_rounds,\
+        stand_threshold, resume):
+            pass
+
+    def iter_rounds(self, num_rounds, stand_threshold, resume=False):
+        """
+        Plays up to `num_rounds` Blackjack rounds like `play_round`,
+        yielding a RoundResult after each one. Stopping early is fine:
+        closing the generator closes the summary file it opened.
+
+        >>> from os import devnull
+        >>> from itertools import islice
+        >>> game = Blackjack(100, Shoe(6), rng=7,\\
+        ... summary=SummaryWriter(devnull), log_level='off')
+        >>> rounds = game.iter_rounds(1000, 17)
+        >>> first = next(rounds)
+        >>> first
+        RoundResult(round=1, player_score=18, dealer_score=18, winner=Tied, bet=5, wallet=100)
+        >>> first.player_hand
+        (8, clubs) (J, clubs)
+        >>> [r.winner for r in islice(rounds, 4)]
+        ['Player', 'Dealer', 'Player', 'Dealer']
+        >>> big = next(r for r in rounds if r.bet >= 20)
+        >>> big.round, big.wallet
+        (17, 100)
+        >>> rounds.close()
+
+        Parameters:
+            num_rounds (int): Number of rounds to play.
+            stand_threshold (int): Score threshold for when the player
+            will stand (ie player stands if they have a score >=
+            this threshold). A Strategy can be passed instead.
+            resume (bool): Keep the current bet instead of starting
+            again from 5, to carry on a session restored by `restore`.
         """
         # This could get pretty long!
         assert isinstance(num_rounds, int)
-        assert isinstance(stand_threshold, int)
+        assert isinstance(stand_threshold, (int, Strategy))
 
-        self.min_bet = 5
+        if not resume:
+            self.min_bet = 5
         self.game_number = 2
         self.num_rounds = num_rounds
         self.stand_threshold = stand_threshold
+        strategy = Strategy.of(stand_threshold)
+        if self.rng is not None:
+            Blackjack.predraw_shuffles(self,\
+            min(num_rounds, Blackjack.shuffle_block))
+        own_summary = self.summary is None
+        if own_summary:
+            self.summary = SummaryWriter(Blackjack.summary_path(self))
+        try:
+            for i in range(1, self.num_rounds + 1):
+                if not Blackjack.start_round(self):
+                    return
+                if self.deck.has_cards():
+                    Blackjack.hit_or_stand(self, self.player_hand, strategy)
+                yield Blackjack.finish_round(self, num_rounds - i,\
+                stand_threshold, own_summary)
+        finally:
+            if own_summary:
+                self.summary.close()
+                self.summary = None
+
+    def start_round(self):
+        """
+        Starts a round: reshuffles a shoe at its cut card, places the bet,
+        shuffles and deals two cards each. Returns False, with the reason
+        in `status`, when there are not enough cards or money to play.
+        The player then hits (see `hit_or_stand` and `pull`) and the round
+        ends with `finish_round`.
+        """
         min_cards = 4
-        results = 0
-        for i in range(1, self.num_rounds + 1):
-            if len(self.deck.get_cards()) < min_cards:
-                self.log += 'Not enough cards for a game.'
-                return None
-            else:
-                if self.wallet < self.min_bet:
-                    self.log += 'Wallet amount ${0} is less than bet amount ${1}.'\
-                    .format(self.wallet, self.min_bet)
-                    return None
-                else:
-                    self.log += 'Round {0} of Blackjack!\n'.format(self.rounds)
-                    self.log += 'wallet: {0}\n'.format(self.wallet)
-                    self.log += 'bet: {0}\n'.format(self.min_bet)
-                    self.deck.shuffle(mongean = randint(0, 6), \
-                    modified_overhand = randint(0, 6))
-
-                    self.deck.deal_hand(self.player_hand)
-                    self.deck.deal_hand(self.dealer_hand)
-                    self.deck.deal_hand(self.player_hand)
-                    self.deck.deal_hand(self.dealer_hand)
-
-                    self.log += 'Player Cards: {0}\n'\
-                    .format(repr(self.player_hand)) +\
-                    'Dealer Cards: {0}\n'.format(repr(self.dealer_hand))
-
-                    if len(self.deck.get_cards()) > 0:
-                        Blackjack.hit_or_stand(self, self.player_hand,\
-                        stand_threshold)
-
-                    self.dealer_hand.reveal_hand()
-                    self.log += \
-                    'Dealer Cards Revealed: {0}\n'.format(repr(self.dealer_hand))
-                    if len(self.deck.get_cards()) > 0:
-                        Blackjack.hit_or_stand(self,\
-                        self.dealer_hand, stand_threshold)
-
-                    results = Blackjack.determine_winner(self,\
-                    Blackjack.calculate_score(self.player_hand),\
-                    Blackjack.calculate_score(self.dealer_hand))
-                    if results == 1:
-                        Blackjack.add_to_file(self, self.player_hand,\
-                        self.dealer_hand, 'Player')
-                        self.rounds += 1
-                    elif results == -1:
-                        Blackjack.add_to_file(self, self.player_hand,\
-                        self.dealer_hand, 'Dealer')
-                        self.rounds += 1
-                    else:
-                        Blackjack.add_to_file(self, self.player_hand,\
-                        self.dealer_hand, 'Tied')
-                        self.rounds += 1
-                    self.player_hand = PlayerHand()
-                    self.dealer_hand = DealerHand()
-
+        if self.instruments is not None:
+            self.round_started = perf_counter_ns()
+        Blackjack.reshuffle_at_cut(self)
+        Blackjack.place_bet(self)
+        if self.deck.remaining() < min_cards:
+            self.status = 'not_enough_cards'
+            if self.log.rounds:
+                self.log.add('no_cards')
+            return False
+        if self.wallet < self.min_bet:
+            self.status = 'insufficient_funds'
+            if self.log.rounds:
+                self.log.add('no_funds', self.wallet, self.min_bet)
+            return False
+        if self.log.rounds:
+            self.log.add('round', self.rounds, self.wallet, self.min_bet)
+        self.bet = self.min_bet
+        mongean, modified_overhand = Blackjack.shuffle_counts(self)
+        self.deck.shuffle(mongean = mongean, \
+        modified_overhand = modified_overhand)
+
+        self.deck.deal_hand(self.player_hand)
+        self.deck.deal_hand(self.dealer_hand)
+        self.deck.deal_hand(self.player_hand)
+        self.deck.deal_hand(self.dealer_hand)
+        if self.log.cards:
+            self.log.add('deal', EventLog.snapshot(self.player_hand),\
+            EventLog.snapshot(self.dealer_hand))
+        if self.instruments is not None:
+            self.hits_started = perf_counter_ns()
+        return True
+
+    def finish_round(self, rounds_left=0, stand_threshold=None,
+                     summary_owned=False):
+        """
+        Ends a round once the player has stopped hitting: the dealer
+        plays, the bet is settled, the round is written to the summary
+        and a checkpoint is saved when one is due (the parameters are
+        those of `save`). Returns the RoundResult.
+        """
+        timed = self.instruments is not None
+        player_hand = self.player_hand
+        dealer_hand = self.dealer_hand
+        dealer_hand.reveal_hand()
+        if self.log.cards:
+            self.log.add('reveal', EventLog.snapshot(dealer_hand))
+        if self.deck.has_cards():
+            Blackjack.hit_or_stand(self, dealer_hand, stand_threshold)
+        if timed:
+            split = self.instruments.record('hit', self.hits_started)
+
+        player_score = Blackjack.calculate_score(player_hand)
+        dealer_score = Blackjack.calculate_score(dealer_hand)
+        result = Blackjack.determine_winner(self, player_score, dealer_score)
+        if timed:
+            split = self.instruments.record('score', split)
+        Blackjack.add_to_file(self, player_hand, dealer_hand,\
+        RoundResult.winners[result])
+        round_number = self.rounds
+        self.rounds += 1
+        if timed:
+            self.instruments.record('summary', split)
+            self.instruments.record('round', self.round_started)
+            self.instruments.tick()
+        self.player_hand = PlayerHand()
+        self.dealer_hand = DealerHand()
+        if (self.checkpoint_path is not None) and \
+        ((self.rounds - 1) % self.checkpoint_every == 0):
+            Blackjack.save(self, self.checkpoint_path, rounds_left,\
+            stand_threshold, summary_owned)
+        return RoundResult(round_number, player_hand, dealer_hand,\
+        player_score, dealer_score, result, self.bet, self.wallet)
+
+    def shuffle_counts(self):
+        """
+        Returns the (mongean, modified_overhand) counts for the next
+        round's shuffle, each between 0 and 5.
+        """
+        max_count = 6
+        if self.rng is None:
+            return randint(0, max_count), randint(0, max_count)
+        if self.shuffle_index == len(self.shuffle_buffer):
+            Blackjack.predraw_shuffles(self, 1)
+        counts = self.shuffle_buffer[self.shuffle_index]
+        self.shuffle_index += 1
+        return counts
+
+    def predraw_shuffles(self, num_rounds):
+        """
+        Draws the shuffle counts for at least `num_rounds` more rounds from
+        `rng` in bulk. Counts are always drawn in blocks of
+        `Blackjack.shuffle_block` rounds, so the same seed gives the same
+        counts however the draws are split up.
+        """
+        assert self.rng is not None
+        max_count = 6
+        available = len(self.shuffle_buffer) - self.shuffle_index
+        if available >= num_rounds:
+            return None
+        blocks = -(-(num_rounds - available) // Blackjack.shuffle_block)
+        drawn = self.rng.integers(0, max_count,\
+        size = (blocks * Blackjack.shuffle_block, 2)).tolist()
+        self.shuffle_buffer = self.shuffle_buffer[self.shuffle_index:] +\
+        [tuple(counts) for counts in drawn]
+        self.shuffle_index = 0
+
+    def reshuffle_at_cut(self):
+        """
+        Reshuffles the shoe between rounds once its cut card is reached,
+        or when too few cards are left to deal a round. A plain Deck is
+        never reshuffled.
+        """
+        min_cards = 4
+        if isinstance(self.deck, Shoe) and (self.deck.cut_card_reached()\
+        or self.deck.remaining() < min_cards):
+            self.deck.reshuffle()
 
+    def place_bet(self):
+        """
+        Sets the bet for the next round from the counter's true count. The
+        bet is left alone when the game has no counter.
+        """
+        base_bet = 5
+        if self.counter is not None:
+            self.min_bet = self.counter.bet(base_bet)
 
     def calculate_score(hand):
         """
@@ -270,8 +532,8 @@ class Blackjack:
         Ace card is dependent on which value would bring the score closer
         (but not over) 21.
 
-        Should be solved using list comprehension and map/filter. No explicit
-        for loops.
+        The hand keeps a running total and Ace count as cards are added,
+        so this is O(1) regardless of the hand size.
 
         Parameters:
             hand: The hand to calculate the score of.
@@ -279,44 +541,7 @@ class Blackjack:
             The best score as an integer value.
         """
         assert isinstance(hand, (PlayerHand, DealerHand))
-        faces = 'KQJ'
-        face_value = 10
-        double_ace = 22
-        ace_value2 = 11
-        blackjack_value = 21
-        if repr(hand) == '':
-            return 0
-        lst = [face_value if str(x.rank) in faces else x.rank for x in \
-        hand.sort_hand()]
-
-        hands1 = [1 if x == 'A' else x for x in lst]
-        hands2 = [ace_value2 if x == 'A' else x for x in lst]
-
-        if (blackjack_value - sum(hands1) >= 0)\
-         & (blackjack_value - sum(hands2) >= 0):
-            if abs(sum(hands1) - blackjack_value) < \
-            abs(sum(hands2) - blackjack_value):
-                return sum(hands1)
-            elif sum(hands2) == double_ace:
-                return ace_value2 + 1
-            else:
-                return sum(hands2)
-        elif (blackjack_value - sum(hands1) < 0)\
-         & (blackjack_value - sum(hands2) < 0):
-            if abs(sum(hands1) - blackjack_value) < \
-            abs(sum(hands2) - blackjack_value):
-                return sum(hands1)
-            elif sum(hands2) == double_ace:
-                return ace_value2 + 1
-            else:
-                return sum(hands2)
-        elif (blackjack_value - sum(hands1) < 0)\
-         & (blackjack_value - sum(hands2) > 0):
-            return sum(hands2)
-        elif sum(hands2) == double_ace:
-            return ace_value2 + 1
-        else:
-            return sum(hands1)
+        return hand.score()
 
     def determine_winner(self, player_score, dealer_score):
         """
@@ -327,53 +552,60 @@ class Blackjack:
         Returns:
             1 if the player won, 0 if it is a tie, and -1 if the dealer won
         """
+        result = Blackjack.outcome(player_score, dealer_score)
+        if self.log.rounds:
+            self.log.add('result', result, player_score, dealer_score)
+        Blackjack.settle_bet(self, result)
+        return result
+
+    def outcome(player_score, dealer_score):
+        """
+        Decides the result of a round from the final scores without
+        touching the log, the wallet or the bet.
+
+        Returns:
+            1 if the player won, 0 if it is a tie, and -1 if the dealer won
+
+        >>> Blackjack.outcome(21, 20), Blackjack.outcome(22, 23)
+        (1, 0)
+        >>> Blackjack.outcome(22, 2), Blackjack.outcome(17, 17)
+        (-1, 0)
+        """
         threshold = 21
         if (player_score == threshold) & (dealer_score != threshold):
-            self.log += \
-            'Player won with a score of {0}. Dealer lost with a score of {1}.'\
-            .format(player_score, dealer_score) + '\n'
-            self.wallet += self.min_bet
-            self.min_bet += 5
             return 1
         if (player_score > threshold) & (dealer_score < threshold):
-            self.log += \
-            'Player lost with a score of {0}. Dealer won with a score of {1}.'\
-            .format(player_score, dealer_score) + '\n'
-            self.wallet -= self.min_bet
-            if self.min_bet > 5:
-                self.min_bet -= 5
             return -1
         elif (player_score < threshold) & (dealer_score > threshold):
-            self.log += \
-            'Player won with a score of {0}. Dealer lost with a score of {1}.'\
-            .format(player_score, dealer_score) + '\n'
-            self.wallet += self.min_bet
-            self.min_bet += 5
             return 1
         elif (player_score == dealer_score) | ((player_score > threshold) &\
         (dealer_score > threshold)):
-            self.log += 'Player and Dealer tie.\n'
             return 0
         else:
             if player_score - dealer_score < 0:
-                self.log += \
-                'Player lost with a score of {0}. Dealer won with a score of {1}.'\
-                .format(player_score, dealer_score) + '\n'
-                self.wallet -= self.min_bet
-                if self.min_bet > 5:
-                    self.min_bet -= 5
                 return -1
             elif player_score - dealer_score > 0:
-                self.log +=\
-                'Player won with a score of {0}. Dealer lost with a score of {1}.'\
-                .format(player_score, dealer_score) + '\n'
-                self.wallet += self.min_bet
-                self.min_bet += 5
                 return 1
             else:
-                self.log += 'Player and Dealer tie.\n'
                 return 0
 
+    def settle_bet(self, result):
+        """
+        Pays out or collects the current bet according to `result` and
+        moves the bet up by 5 after a win or down by 5 (never below 5)
+        after a loss. Ties leave the wallet and the bet unchanged. With a
+        counter the bet is not moved, since `place_bet` sets it.
+        """
+        if self.counter is not None:
+            self.wallet += result * self.min_bet
+        elif result == 1:
+            self.wallet += self.min_bet
+            self.min_bet += 5
+        elif result == -1:
+            self.wallet -= self.min_bet
+            if self.min_bet > 5:
+                self.min_bet -= 5
+
     def hit_or_stand(self, hand, stand_threshold):
         """
         Deals cards to hand until the hand score has reached or surpassed
@@ -383,29 +615,222 @@ class Blackjack:
             hand: The hand the deal the cards to depending on its score.
             stand_threshold: Score threshold for when the player
             will stand (ie player stands if they have a score >=
-            this threshold).
+            this threshold), or a Strategy deciding each hit. The
+            dealer always plays `dealer_strategy`.
         """
-        dealer_threshold = 17
+        upcard = self.dealer_hand.upcard
         if isinstance(hand, DealerHand):
-            while Blackjack.calculate_score(self.dealer_hand)\
-            < dealer_threshold:
-                self.log += 'Dealer pulled a ' \
-                + repr(self.deck.get_cards()[0]) + '\n'
-                self.deck.deal_hand(hand)
+            while self.dealer_strategy.hit(self.dealer_hand, upcard):
+                Blackjack.pull(self, hand)
 
         elif isinstance(hand, PlayerHand):
-            while Blackjack.calculate_score(self.player_hand)\
-             < stand_threshold:
-                self.log += 'Player pulled a '\
-                + repr(self.deck.get_cards()[0]) + '\n'
-                self.deck.deal_hand(hand)
+            strategy = Strategy.of(stand_threshold)
+            while strategy.hit(self.player_hand, upcard):
+                Blackjack.pull(self, hand)
 
+    def pull(self, hand):
+        """
+        Deals one more card to `hand` and logs it.
+        """
+        if self.log.cards:
+            self.log.add('pull', 'Dealer' if isinstance(hand, DealerHand)\
+            else 'Player', EventLog.snapshot_card(self.deck.peek()))
+        self.deck.deal_hand(hand)
+
+
+    def stats(self):
+        """
+        Returns the counters and per-phase timings collected by
+        `instruments` (see `Instruments.stats`), or an empty dictionary
+        when the game is not instrumented.
+        """
+        if self.instruments is None:
+            return {}
+        return self.instruments.stats()
+
+    def checkpoint(self, path, every):
+        """
+        Makes `play_round` save the session to `path` (see `save`) after
+        every `every` rounds. Resume it with `Blackjack.resume(path)`.
+        """
+        assert isinstance(every, int)
+        assert every > 0
+        self.checkpoint_path = path
+        self.checkpoint_every = every
+
+    def snapshot(self, rounds_left=0, stand_threshold=None,
+                 summary_owned=False, log_path=None):
+        """
+        Returns the state of the session between two rounds as a
+        JSON-compatible dictionary: wallet, bet, round counter, the deck
+        order as card codes, the random state and the pending shuffle
+        counts, the counter, the log events and how far the summary file
+        has been written. The summary writer is flushed first.
+
+        With a `log_path`, the log events are written there by `save_log`
+        and only the length of that file is kept, so the snapshot does
+        not grow with the number of rounds played.
+
+        Parameters:
+            rounds_left (int): Rounds still to play, for `resume`.
+            stand_threshold (int): Threshold to play them with. Strategy
+            objects are not saved.
+            summary_owned (bool): Whether the summary writer was opened by
+            `play_round`, which opens a new one when it is resumed.
+            log_path (str): File to keep the log events in, or None to
+            put them in the snapshot.
+        """
+        if self.summary is not None:
+            self.summary.flush()
+            summary_path = self.summary.path
+        else:
+            summary_path = Blackjack.summary_path(self)
+        summary = None
+        if (self.summary is not None) and (not summary_owned):
+            summary = {'kind': type(self.summary).__name__,
+                       'buffer_size': self.summary.buffer_size,
+                       'max_seconds': self.summary.max_seconds}
+        if self.rng is None:
+            kind, keys, position, has_gauss, gauss = np.random.get_state()
+            rng = {'global': [kind, keys.astype('<u4').tobytes().hex(),\
+            position, has_gauss, gauss]}
+        else:
+            rng = {'generator': self.rng.bit_generator.state}
+        pending = self.shuffle_buffer[self.shuffle_index:]
+        if not isinstance(stand_threshold, int):
+            stand_threshold = None
+        log, log_file = self.log.events, None
+        if log_path is not None:
+            log, log_file = None, Blackjack.save_log(self, log_path)
+        return {'wallet': self.wallet, 'min_bet': self.min_bet,
+                'rounds': self.rounds, 'game_number': self.game_number,
+                'deck': self.deck.state(), 'rng': rng,
+                'shuffles': bytes([count for counts in pending\
+                for count in counts]).hex(),
+                'counter': None if self.counter is None\
+                else self.counter.state(),
+                'log_level': self.log.level, 'log': log,
+                'log_file': log_file,
+                'summary': summary,
+                'summary_file': {'path': summary_path,
+                                 'size': path.getsize(summary_path)\
+                                 if path.exists(summary_path) else 0},
+                'checkpoint': [self.checkpoint_path, self.checkpoint_every],
+                'rounds_left': rounds_left,
+                'stand_threshold': stand_threshold}
+
+    def restore(state):
+        """
+        Returns the session described by a dictionary from `snapshot`.
+        The summary and log files are cut back to where they were when
+        the snapshot was taken, so rounds written after it are not
+        written twice. A
+        session without its own `rng` sets the global numpy random state.
+        """
+        deck = Deck.from_state(state['deck'])
+        game = Blackjack(state['wallet'], deck, log_level = state['log_level'])
+        if state['counter'] is not None:
+            game.counter = CardCounter.from_state(state['counter'])
+            deck.counter = game.counter
+        if 'generator' in state['rng']:
+            saved = state['rng']['generator']
+            game.rng = np.random.Generator(getattr(np.random,\
+            saved['bit_generator'])())
+            game.rng.bit_generator.state = saved
+        else:
+            kind, keys, position, has_gauss, gauss = state['rng']['global']
+            np.random.set_state((kind,\
+            np.frombuffer(bytes.fromhex(keys), '<u4'), position, has_gauss,\
+            gauss))
+        counts = bytes.fromhex(state['shuffles'])
+        game.shuffle_buffer = list(zip(counts[::2], counts[1::2]))
+        game.min_bet = state['min_bet']
+        game.rounds = state['rounds']
+        game.game_number = state['game_number']
+        events = state['log']
+        log_file = state['log_file']
+        if log_file is not None:
+            with open(log_file['path'], 'r+b') as f:
+                events = [json.loads(line) for line in\
+                f.read(log_file['size']).decode('utf-8').splitlines()]
+                f.truncate(log_file['size'])
+            game.log_saved = (log_file['path'], len(events))
+        game.log.events = [tuple([tuple(part) if isinstance(part, list)\
+        else part for part in event]) for event in events]
+        game.checkpoint_path, game.checkpoint_every = state['checkpoint']
+
+        summary_file = state['summary_file']
+        if path.exists(summary_file['path']) and\
+        (path.getsize(summary_file['path']) > summary_file['size']):
+            with open(summary_file['path'], 'r+b') as f:
+                f.truncate(summary_file['size'])
+        if state['summary'] is not None:
+            writers = {'SummaryWriter': SummaryWriter,
+                       'RecordWriter': RecordWriter,
+                       'NullWriter': NullWriter}
+            game.summary = writers[state['summary']['kind']](\
+            summary_file['path'], state['summary']['buffer_size'],\
+            state['summary']['max_seconds'])
+        return game
+
+    def save(self, path, rounds_left=0, stand_threshold=None,
+             summary_owned=False):
+        """
+        Writes `snapshot` to `path` as JSON, with the log events in
+        `path + '.log'`. The file is replaced in one step, so a crash
+        while saving leaves the previous checkpoint.
+        """
+        temporary = path + '.tmp'
+        state = Blackjack.snapshot(self, rounds_left, stand_threshold,\
+        summary_owned, path + '.log')
+        with open(temporary, 'w', encoding = 'utf-8') as f:
+            json.dump(state, f, separators = (',', ':'))
+        replace(temporary, path)
+
+    def save_log(self, log_path):
+        """
+        Writes the log events to `log_path`, one JSON list per line, and
+        returns the file's path and size for `snapshot`. Only the events
+        added since the last call with the same path are appended.
+        """
+        written = 0
+        if (self.log_saved is not None) and (self.log_saved[0] == log_path):
+            written = self.log_saved[1]
+        with open(log_path, 'ab' if written else 'wb') as f:
+            f.write(''.join([json.dumps(event, separators = (',', ':'))\
+            + '\n' for event in self.log.events[written:]]).encode('utf-8'))
+            size = f.tell()
+        self.log_saved = (log_path, len(self.log.events))
+        return {'path': log_path, 'size': size}
+
+    def load(path):
+        """
+        Returns the session saved at `path` by `save`.
+        """
+        with open(path, encoding = 'utf-8') as f:
+            return Blackjack.restore(json.load(f))
+
+    def resume(path):
+        """
+        Loads the session saved at `path` and plays the rounds that were
+        left when it was saved, exactly as the original `play_round`
+        would have. Returns the session.
+        """
+        with open(path, encoding = 'utf-8') as f:
+            state = json.load(f)
+        game = Blackjack.restore(state)
+        if (state['rounds_left'] > 0) and\
+        (state['stand_threshold'] is not None):
+            game.play_round(state['rounds_left'], state['stand_threshold'],\
+            resume = True)
+        return game
 
     def get_log(self):
-        return self.log
+        return self.log.render()
 
     def reset_log(self):
-        self.log = ""
+        self.log.clear()
+        self.log_saved = None
 
     def add_to_file(self, player_hand, dealer_hand, result):
         """
@@ -416,17 +841,18 @@ class Blackjack:
         """
 
         # Remember to use encoding = "utf-8"
-#        if self.rounds == 0:
-#            with open("./game_summaries/game_summary"\
-#            + str(self.game_number)\
-#            + ".txt", 'a', encoding = 'utf-8') as f:
-#            f.write()
+        # Inside play_round the rounds go through a buffered SummaryWriter
+        # (or RecordWriter) that keeps the file open for the whole call.
+        if self.summary is None:
+            with open(Blackjack.summary_path(self), 'a',\
+            encoding = 'utf-8') as f:
+                f.write(SummaryWriter.format_round(self.rounds, player_hand,\
+                dealer_hand, result))
+        else:
+            self.summary.write_round(self.rounds, player_hand, dealer_hand,\
+            result, wallet = self.wallet, bet = self.bet)
 
-        with open("./game_summaries/game_summary"\
+    def summary_path(self):
+        return "./game_summaries/game_summary"\
         + str(self.game_number)\
-        + ".txt", 'a', encoding = 'utf-8') as f:
-            f.write('ROUND {0}:\nPlayer Hand:\n{1}\n'\
-            .format(self.rounds, player_hand))
-            f.write('Dealer Hand:\n{0}\n'.format(dealer_hand))
-            f.write('Winner of ROUND {0}: {1}\n\n'\
-            .format(self.rounds, result))
+        + ".txt"
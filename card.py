@@ -1,3 +1,5 @@
+from itertools import product
+
 class Card:
     """
     Card class.
@@ -53,9 +55,37 @@ class Card:
     |__A|
     >>> card_3
     (A, diamonds)
+
+    # Doctests for the compact encoding
+    >>> card_3.code, card_3.get_rank(), card_3.get_suit(), card_3.value
+    (49, 'A', 'diamonds', 1)
+    >>> sorted([card_1, Card(10, "hearts"), Card("J", "clubs"), card_2])
+    [(10, hearts), (K, spades), (J, clubs), (A, spades)]
+    >>> hasattr(card_1, '__dict__')
+    False
     """
 
     # Class Attribute(s)
+    # A card is stored as a single code from 0 to 51, in fresh deck order:
+    # code = 4 * (rank - 2) + suit index, so the Aces are codes 48 to 51.
+    # Everything else about a card is looked up in the tables below, which
+    # are shared by every card instead of being stored on each one.
+    __slots__ = ('code', 'visible')
+    suits = ('clubs', 'diamonds', 'hearts', 'spades')
+    ranks = tuple(range(2, 11)) + ('J', 'Q', 'K', 'A')
+    # Blackjack value with Aces counted as 1
+    values = tuple(min(i // 4 + 2, 10) if i < 48 else 1 for i in range(52))
+    # Number cards come first, then Q < K < J < A, then suits in order
+    sort_keys = tuple(4 * order + suit for order in \
+    (0, 1, 2, 3, 4, 5, 6, 7, 8, 11, 9, 10, 12) for suit in range(4))
+    # Rendered text of every card by code, and of a face down card
+    symbols = ('♣', '♦', '♥', '♠')
+    arts = tuple('____\n|{0}  |\n| {1} |\n|__{0}|'.format(rank, symbol)\
+    for rank, symbol in product(ranks, symbols))
+    reprs = tuple('({0}, {1})'.format(rank, suit)\
+    for rank, suit in product(ranks, suits))
+    hidden_art = '____\n|?  |\n| ? |\n|__?|'
+    hidden_repr = '(?, ?)'
 
     def __init__(self, rank, suit, visible=True):
         """
@@ -73,36 +103,46 @@ class Card:
             assert 2 <= rank <= 10
         if isinstance(rank, str):
             assert rank.lower() in 'akqj'
+            rank = rank.upper()
+        assert suit in Card.suits
 
-        self.rank = rank
-        self.suit = suit
+        self.code = 4 * Card.ranks.index(rank) + Card.suits.index(suit)
         self.visible = visible
 
+    def from_code(code, visible=True):
+        """
+        Creates the card with the given code (0 to 51) without going
+        through the rank and suit checks in `__init__`.
+
+        >>> Card.from_code(0), Card.from_code(51)
+        ((2, clubs), (A, spades))
+        >>> Card.from_code(Card("Q", "hearts").code)
+        (Q, hearts)
+        """
+        card = object.__new__(Card)
+        card.code = code
+        card.visible = visible
+        return card
+
+    @property
+    def rank(self):
+        return Card.ranks[self.code >> 2]
+
+    @property
+    def suit(self):
+        return Card.suits[self.code & 3]
+
+    @property
+    def value(self):
+        return Card.values[self.code]
+
+    @property
+    def sort_key(self):
+        return Card.sort_keys[self.code]
+
     def __lt__(self, other_card):
-        if isinstance(self.rank, str) & isinstance(other_card.rank, str):
-            if self.rank < other_card.rank:
-                return False
-            elif self.rank > other_card.rank:
-                return True
-            else:
-                if self.suit > other_card.suit:
-                    return False
-                else:
-                    return True
-        elif isinstance(self.rank, str) & isinstance(other_card.rank, int):
-            return False
-        elif isinstance(self.rank, int) & isinstance(other_card.rank, str):
-            return True
-        else:
-            if self.rank < other_card.rank:
-                return True
-            elif self.rank > other_card.rank:
-                return False
-            else:
-                if self.suit > other_card.suit:
-                    return False
-                else:
-                    return True
+        return Card.sort_keys[self.code] < Card.sort_keys[other_card.code]
+
     def __str__(self):
         """
         Returns ASCII art of a card with the rank and suit. If the card is
@@ -118,31 +158,17 @@ class Card:
         | ? |
         |__?|
         """
-        suit = ""
-        if self.suit == 'diamonds':
-            suit = "♦"
-        elif self.suit == 'spades':
-            suit = "♠"
-        elif self.suit == 'clubs':
-            suit = "♣"
-        else:
-            suit = "♥"
-
         if self.visible:
-            return '____\n|{0}  |\n| {1} |\n|__{0}|'\
-            .format(self.rank, suit)
-        else:
-            return '____\n|{0}  |\n| {0} |\n|__{0}|'\
-            .format('?')
+            return Card.arts[self.code]
+        return Card.hidden_art
     def __repr__(self):
         """
         Returns (<rank>, <suit>). If the card is hidden, question marks are
         put in place of the actual rank and suit.
         """
         if self.visible:
-            return '({0}, {1})'.format(self.rank, self.suit)
-        else:
-            return '({0}, {0})'.format('?')
+            return Card.reprs[self.code]
+        return Card.hidden_repr
 
 
     def get_rank(self):
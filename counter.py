@@ -0,0 +1,109 @@
+from card import Card
+
+class CardCounter:
+    """
+    Hi-Lo card counter. Tracks the running count, the true count and how
+    many cards of each blackjack value are left, updated one card at a
+    time as a Deck or Shoe deals (see `Deck.track`).
+
+    Cards 2 to 6 count +1, 7 to 9 count 0, ten-valued cards and Aces
+    count -1. The composition uses the order of `DealerOdds.counts`:
+    Aces, 2s, ..., 9s and ten-valued cards.
+
+    >>> from deck import Deck
+    >>> from hand import PlayerHand
+    >>> deck = Deck()
+    >>> counter = CardCounter()
+    >>> deck.track(counter)
+    >>> counter.running, counter.remaining, counter.true_count()
+    (0, 52, 0.0)
+    >>> hand = PlayerHand()
+    >>> for i in range(8):
+    ...     deck.deal_hand(hand)
+    >>> hand
+    (2, clubs) (2, diamonds) (2, hearts) (2, spades) (3, clubs) (3, diamonds) (3, hearts) (3, spades)
+    >>> counter.running, counter.remaining, counter.true_count()
+    (8, 44, 9.454545454545455)
+    >>> counter.composition()
+    (4, 0, 0, 4, 4, 4, 4, 4, 4, 16)
+    >>> counter.bet(5)
+    40
+
+    # Shuffling what is left of a deck changes nothing
+    >>> deck.shuffle(mongean=2)
+    >>> counter.running, counter.remaining
+    (8, 44)
+    """
+
+    # Class Attribute(s)
+    # Hi-Lo tag of each card code
+    tags = tuple(1 if 2 <= value <= 6 else -1 if value in (1, 10) else 0\
+    for value in Card.values)
+
+    def __init__(self, spread=8):
+        """
+        Parameters:
+            spread (int): Largest bet `bet` returns, in multiples of the
+            base bet.
+        """
+        assert isinstance(spread, int)
+        assert spread >= 1
+        self.spread = spread
+        self.running = 0
+        self.remaining = 0
+        self.histogram = [0] * 10
+
+    def reset(self, codes):
+        """
+        Starts counting again from a freshly shuffled set of cards, given
+        by their codes (see `Card.from_code`).
+        """
+        self.running = 0
+        self.remaining = 0
+        self.histogram = [0] * 10
+        for code in codes:
+            self.histogram[Card.values[code] - 1] += 1
+            self.remaining += 1
+
+    def count(self, code):
+        """
+        Counts one dealt card, given by its code.
+        """
+        self.running += CardCounter.tags[code]
+        self.histogram[Card.values[code] - 1] -= 1
+        self.remaining -= 1
+
+    def true_count(self):
+        """
+        Returns the running count per 52 cards left to deal.
+        """
+        deck_size = 52
+        if self.remaining == 0:
+            return 0.0
+        return self.running * deck_size / self.remaining
+
+    def composition(self):
+        """
+        Returns the counts of each value left to deal, which can be passed
+        to `DealerOdds` as a composition.
+        """
+        return tuple(self.histogram)
+
+    def state(self):
+        return {'spread': self.spread, 'running': self.running,
+                'remaining': self.remaining, 'histogram': self.histogram}
+
+    def from_state(state):
+        counter = CardCounter(state['spread'])
+        counter.running = state['running']
+        counter.remaining = state['remaining']
+        counter.histogram = list(state['histogram'])
+        return counter
+
+    def bet(self, base_bet):
+        """
+        Returns the bet for the next round: one `base_bet` per point of
+        true count, at least one and at most `spread`.
+        """
+        units = min(max(int(CardCounter.true_count(self)), 1), self.spread)
+        return base_bet * units
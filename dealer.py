@@ -0,0 +1,190 @@
+from hand import PlayerHand
+
+class DealerOdds:
+    """
+    Exact probabilities of the dealer's final score for each upcard, for
+    the dealer rule in `Blackjack.hit_or_stand` (draw while the score is
+    under 17, with `Blackjack.calculate_score` scoring).
+
+    Cards are grouped by blackjack value, so a composition is a tuple of
+    10 counts: Aces, 2s, ..., 9s and ten-valued cards. Without a
+    composition an infinite deck is assumed.
+
+    >>> odds = DealerOdds.distribution(10)
+    >>> sorted(odds, key = str)
+    [17, 18, 19, 20, 21, 'bust']
+    >>> round(sum(odds.values()), 12)
+    1.0
+    >>> round(odds['bust'], 4), round(odds[20], 4)
+    (0.2121, 0.3422)
+
+    # A finite composition: only 7s and ten-valued cards are left
+    >>> counts = (0, 0, 0, 0, 0, 0, 1, 0, 0, 3)
+    >>> DealerOdds.distribution(10, counts)
+    {17: 0.25, 20: 0.75}
+
+    >>> from deck import Deck
+    >>> DealerOdds.counts(Deck().get_cards())
+    (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+    >>> table = DealerOdds.table()
+    >>> len(table), round(table[1][21], 4)
+    (10, 0.3584)
+    """
+
+    # Class Attribute(s)
+    dealer_threshold = 17
+    # Relative weights of each value in an infinite deck
+    infinite = (1, 1, 1, 1, 1, 1, 1, 1, 1, 4)
+    # Final scores in the order used by `finals_packed`: 17 to 21, bust,
+    # then the scores a dealer can be left on when the cards run out
+    finals_order = (17, 18, 19, 20, 21, 'bust') + tuple(range(2, 17))
+    # Maps a final score to the distribution of a dealer certain to end
+    # on it (see `certain`)
+    final = {}
+    # Maps (hard total, Aces) packed by `key` to the final score
+    # distribution of a hand still drawing from an infinite deck. Finite
+    # compositions are cached by the caller, see `finals_packed`.
+    cache = {}
+
+    def counts(cards):
+        """
+        Returns the composition of a list of cards, for example
+        `Deck.get_cards()`.
+        """
+        counts = [0] * 10
+        for card in cards:
+            counts[card.value - 1] += 1
+        return tuple(counts)
+
+    def pack(counts):
+        """
+        Packs a composition into one integer, 8 bits per value with the
+        Aces in the lowest bits.
+
+        >>> hex(DealerOdds.pack((1, 2, 0, 0, 0, 0, 0, 0, 0, 3)))
+        '0x3000000000000000201'
+        """
+        packed = 0
+        for count in reversed(counts):
+            assert 0 <= count < 256
+            packed = (packed << 8) | count
+        return packed
+
+    def key(hard_total, aces, packed):
+        """
+        Returns a compact cache key for a dealer hand drawing from the
+        packed composition (None for an infinite deck). Two or more Aces
+        always score the same, so they share a key.
+        """
+        state = (hard_total << 2) | min(aces, 2)
+        if packed is None:
+            return -state - 1
+        return (packed << 8) | state
+
+    def draws(packed, total):
+        """
+        Yields (value, probability, composition left) for every card value
+        that can be drawn next from a packed composition of `total` cards.
+        """
+        for i in range(10):
+            count = (packed >> (8 * i)) & 255
+            if count:
+                yield i + 1, count / total, packed - (1 << (8 * i))
+
+    def finals(hard_total, aces, counts=None):
+        """
+        Returns the distribution of the dealer's final score from a hand
+        with the given hard total and number of Aces, drawing from
+        `counts` (None for an infinite deck), as a dictionary. Busted
+        scores are grouped under 'bust'. If a finite composition runs out
+        before the dealer reaches 17, the score at that point is final.
+        """
+        if counts is None:
+            odds = DealerOdds.finals_packed(hard_total, aces, None, 0)
+        else:
+            odds = DealerOdds.finals_packed(hard_total, aces,\
+            DealerOdds.pack(counts), sum(counts))
+        return {DealerOdds.finals_order[i]: p for i, p in enumerate(odds)\
+        if p > 0}
+
+    def finals_packed(hard_total, aces, packed, total, cache=None):
+        """
+        Same as `finals`, for a composition packed by `pack` (None for an
+        infinite deck) holding `total` cards, but returns a tuple of
+        probabilities in the order of `DealerOdds.finals_order`. The
+        tuple stops after the bust entry unless a composition ran out.
+
+        Distributions of hands still drawing are kept in `cache`, a
+        dictionary keyed by `key`, so a caller such as Solver can share
+        them between calls and free them when it is done. Without one,
+        the infinite deck uses `DealerOdds.cache` and a finite
+        composition a new dictionary for this call.
+        """
+        score = PlayerHand.best_score(hard_total, aces)
+        if score >= DealerOdds.dealer_threshold:
+            return DealerOdds.certain(score)
+        if (packed is not None) & (total == 0):
+            return DealerOdds.certain(score)
+        if cache is None:
+            cache = DealerOdds.cache if packed is None else {}
+        key = DealerOdds.key(hard_total, aces, packed)
+        if key in cache:
+            return cache[key]
+
+        if packed is None:
+            weights = sum(DealerOdds.infinite)
+            draws = [(value, weight / weights, None) for value, weight\
+            in enumerate(DealerOdds.infinite, 1)]
+        else:
+            draws = DealerOdds.draws(packed, total)
+        odds = [0.0] * 6
+        for value, chance, left in draws:
+            drawn = DealerOdds.finals_packed(hard_total + value,\
+            aces + (value == 1), left, total - 1, cache)
+            if len(drawn) > len(odds):
+                odds.extend([0.0] * (len(drawn) - len(odds)))
+            for i, p in enumerate(drawn):
+                odds[i] += p * chance
+        odds = tuple(odds)
+        cache[key] = odds
+        return odds
+
+    def certain(score):
+        """
+        Returns the distribution, in `finals_packed` form, of a dealer who
+        finishes on `score`.
+        """
+        if score not in DealerOdds.final:
+            index = DealerOdds.finals_order.index(score if score <= 21\
+            else 'bust')
+            odds = [0.0] * max(6, index + 1)
+            odds[index] = 1.0
+            DealerOdds.final[score] = tuple(odds)
+        return DealerOdds.final[score]
+
+    def distribution(upcard, counts=None):
+        """
+        Returns the distribution of the dealer's final score given the
+        value of the upcard (1 for an Ace, 10 for ten-valued cards). The
+        hole card is drawn from `counts`, which should already exclude the
+        upcard.
+        """
+        assert 1 <= upcard <= 10
+        return DealerOdds.finals(upcard, int(upcard == 1), counts)
+
+    def table(counts=None):
+        """
+        Returns a dictionary mapping every upcard value to its
+        distribution. With a finite composition the upcard itself is taken
+        out of `counts` first.
+        """
+        table = {}
+        for upcard in range(1, 11):
+            remaining = counts
+            if counts is not None:
+                if counts[upcard - 1] == 0:
+                    continue
+                remaining = counts[:upcard - 1] + (counts[upcard - 1] - 1,)\
+                + counts[upcard:]
+            table[upcard] = DealerOdds.distribution(upcard, remaining)
+        return table
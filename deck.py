@@ -18,6 +18,11 @@ class Deck:
     >>> deck.deal_hand(hand)
     >>> deck.get_cards()[0]
     (Q, clubs)
+    >>> deck.peek(), deck.remaining()
+    ((Q, clubs), 51)
+    >>> deck.shuffle(mongean=1)
+    >>> deck.peek(), deck.remaining()
+    ((10, clubs), 51)
     """
 
     # Class Attribute(s)
@@ -26,10 +31,12 @@ class Deck:
         """
         Creates a Deck instance containing cards sorted in ascending order.
         """
-        upper_bound = 15
-        suits = ['clubs', 'diamonds', 'hearts', 'spades']
-        self.deck = [Card(i, suit) \
-        for i in range(2, upper_bound) for suit in suits]
+        deck_size = 52
+        self.deck = [Card.from_code(code) for code in range(deck_size)]
+        # Index of the top card. Cards before it have already been dealt.
+        self.top = 0
+        # CardCounter told about every card dealt, see `track`
+        self.counter = None
 
     def shuffle(self, **shuffle_and_count):
         """Shuffles the deck using a variety of different shuffles.
@@ -44,26 +51,229 @@ class Deck:
             assert isinstance(key, str)
             assert (key == 'modified_overhand') | (key == 'mongean')
 
-        for key, value in shuffle_and_count.items():
-            if key == 'modified_overhand':
-                self.deck =\
-                Shuffle.modified_overhand(self.deck, value)
+        if self.top > 0:
+            self.deck = self.deck[self.top:]
+            self.top = 0
 
-        for key, value in shuffle_and_count.items():
-            if key == 'mongean':
-                for i in range(value):
-                    self.deck = Shuffle.mongean(self.deck)
+        order = Shuffle.combined(len(self.deck), **shuffle_and_count)
+        self.deck = [self.deck[i] for i in order]
 
 
+    def track(self, counter):
+        """
+        Counts every card dealt from now on with `counter`, a CardCounter,
+        starting from the cards left to deal. Shuffling the cards that are
+        left does not change the count.
+        """
+        self.counter = counter
+        counter.reset([card.code for card in Deck.get_cards(self)])
+
     def deal_hand(self, hand):
         """
         Takes the first card from the deck and adds it to `hand`.
         """
         assert isinstance(hand, PlayerHand)
         self.hand = hand
-        self.hand.add_card(self.deck[0])
-        self.deck = self.deck[1:]
+        card = self.deck[self.top]
+        self.hand.add_card(card)
+        self.top += 1
+        if self.counter is not None:
+            self.counter.count(card.code)
+
+    def peek(self):
+        """
+        Returns the card that will be dealt next without dealing it.
+        """
+        return self.deck[self.top]
+
+    def remaining(self):
+        """
+        Returns the number of cards left to deal.
+        """
+        return len(self.deck) - self.top
+
+    def has_cards(self):
+        """
+        Returns whether another card can be dealt.
+        """
+        return Deck.remaining(self) > 0
+
+    def get_cards(self):
+        """
+        Returns a list of the cards left to deal, top card first.
+        """
+        return self.deck[self.top:]
+
+    def state(self):
+        """
+        Returns the cards left to deal as a JSON-compatible dictionary,
+        with their codes (see `Card.from_code`) in hex. The counter is not
+        included.
+        """
+        return {'kind': 'Deck', 'cards': bytes([card.code for card\
+        in Deck.get_cards(self)]).hex()}
+
+    def from_state(state):
+        """
+        Returns the Deck or Shoe described by a dictionary from `state`.
+
+        >>> shoe = Shoe(2, penetration=0.5, mongean=1)
+        >>> hand = PlayerHand()
+        >>> for i in range(60):
+        ...     shoe.deal_hand(hand)
+        >>> copy = Deck.from_state(shoe.state())
+        >>> [c.code for c in copy.get_cards()] == \\
+        ... [c.code for c in shoe.get_cards()]
+        True
+        >>> copy.remaining(), copy.cut_card_reached(), copy.shuffle_and_count
+        (44, True, {'mongean': 1})
+        """
+        cards = bytes.fromhex(state['cards'])
+        if state['kind'] == 'Shoe':
+            deck = Shoe(state['num_decks'], state['penetration'],\
+            **state['shuffle_and_count'])
+            deck.deck = bytearray(cards)
+            deck.reshuffles = state['reshuffles']
+        else:
+            deck = Deck()
+            deck.deck = [Card.from_code(code) for code in cards]
+        return deck
+
+
+class Shoe(Deck):
+    """
+    Shoe of 1 to 8 decks with a cut card. The cards are stored as a
+    compact array of card codes (see `Card.from_code`) and a Card is only
+    created when it is dealt or looked at.
+
+    >>> shoe = Shoe(2, penetration=0.5, mongean=1)
+    >>> shoe.remaining()
+    104
+    >>> shoe.get_cards()[:3]
+    [(2, clubs), (2, diamonds), (2, hearts)]
+
+    >>> hand = PlayerHand()
+    >>> for i in range(51):
+    ...     shoe.deal_hand(hand)
+    >>> shoe.cut_card_reached()
+    False
+    >>> shoe.deal_hand(hand)
+    >>> shoe.cut_card_reached()
+    True
+    >>> shoe.reshuffle()
+    >>> shoe.remaining(), shoe.reshuffles, shoe.cut_card_reached()
+    (104, 1, False)
+    >>> shoe.peek()
+    (A, spades)
+
+    # An empty shoe is reshuffled instead of running out
+    >>> shoe = Shoe(1, penetration=1.0)
+    >>> for i in range(53):
+    ...     shoe.deal_hand(hand)
+    >>> shoe.remaining(), shoe.reshuffles
+    (51, 1)
+
+    # A tracked shoe starts counting again when it is reshuffled
+    >>> from counter import CardCounter
+    >>> counter = CardCounter()
+    >>> shoe.track(counter)
+    >>> for i in range(51):
+    ...     shoe.deal_hand(hand)
+    >>> counter.running, counter.remaining
+    (-1, 0)
+    >>> shoe.deal_hand(hand)
+    >>> counter.remaining, shoe.reshuffles
+    (51, 2)
+    """
+
+    def __init__(self, num_decks=1, penetration=0.75, **shuffle_and_count):
+        """
+        Creates a shoe of `num_decks` decks stacked in ascending order.
+
+        Parameters:
+            num_decks (int): Number of 52 card decks in the shoe.
+            penetration (float): Fraction of the shoe dealt before the
+            cut card is reached.
+            shuffle_and_count: keyword arguments passed to `shuffle`
+            every time the shoe is reshuffled.
+        """
+        assert isinstance(num_decks, int)
+        assert 1 <= num_decks <= 8
+        assert 0 < penetration <= 1
+        deck_size = 52
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.shuffle_and_count = shuffle_and_count
+        self.size = num_decks * deck_size
+        self.cut = int(self.size * penetration)
+        self.reshuffles = 0
+        self.deck = bytearray(range(deck_size)) * num_decks
+        self.top = 0
+        self.counter = None
+
+    def shuffle(self, **shuffle_and_count):
+        Deck.shuffle(self, **shuffle_and_count)
+        self.deck = bytearray(self.deck)
+
+    def reshuffle(self):
+        """
+        Gathers every card back into the shoe and shuffles it with the
+        keyword arguments given when the shoe was created.
+        """
+        self.deck = bytearray(range(52)) * self.num_decks
+        self.top = 0
+        self.shuffle(**self.shuffle_and_count)
+        self.reshuffles += 1
+        if self.counter is not None:
+            self.counter.reset(self.deck)
+
+    def cut_card_reached(self):
+        """
+        Returns whether the cut card has been dealt past. Counts the cards
+        dealt since the last reshuffle, so shuffling the rest of the shoe
+        in between rounds does not move the cut card.
+        """
+        return self.size - self.remaining() >= self.cut
+
+    def deal_hand(self, hand):
+        """
+        Takes the first card from the shoe and adds it to `hand`. An empty
+        shoe is reshuffled first.
+        """
+        assert isinstance(hand, PlayerHand)
+        if self.top == len(self.deck):
+            self.reshuffle()
+        self.hand = hand
+        code = self.deck[self.top]
+        self.hand.add_card(Card.from_code(code))
+        self.top += 1
+        if self.counter is not None:
+            self.counter.count(code)
 
+    def peek(self):
+        """
+        Returns the card that will be dealt next. An empty shoe is
+        reshuffled first.
+        """
+        if self.top == len(self.deck):
+            self.reshuffle()
+        return Card.from_code(self.deck[self.top])
+
+    def has_cards(self):
+        """
+        A shoe can always deal, since it is reshuffled when empty.
+        """
+        return True
 
     def get_cards(self):
-        return self.deck
+        return [Card.from_code(code) for code in self.deck[self.top:]]
+
+    def track(self, counter):
+        self.counter = counter
+        counter.reset(self.deck[self.top:])
+
+    def state(self):
+        return {'kind': 'Shoe', 'cards': self.deck[self.top:].hex(),
+                'num_decks': self.num_decks, 'penetration': self.penetration,
+                'shuffle_and_count': self.shuffle_and_count,
+                'reshuffles': self.reshuffles}
@@ -0,0 +1,178 @@
+from fractions import Fraction
+
+from blackjack import Blackjack
+from card import Card
+from hand import PlayerHand
+from shuffle import Shuffle
+from strategy import Strategy
+
+class ShuffleOutcomes:
+    """
+    Every round `Blackjack.play_round` can deal from a given deck state.
+
+    A round shuffles with (mongean, modified_overhand) counts drawn from
+    `randint(0, 6)`, and both shuffles are deterministic, so the cards
+    left to deal reach one of only 36 orders, each with probability
+    1/36. For each of them this keeps the cards dealt in the round, the
+    cards left afterwards and the result, cached by the cards left to
+    deal before the shuffle. `session` chains rounds into the exact
+    distribution of the final wallet by dynamic programming.
+
+    Rounds are dealt like `Blackjack.play_round` from a plain Deck
+    without a counter: two cards each, the player hits following
+    `stand_threshold`, the dealer following `Blackjack.dealer_strategy`,
+    and the bet moves as in `Blackjack.settle_bet`. A hand stops drawing
+    when the cards run out, as in Solver.
+
+    >>> from deck import Deck
+    >>> outcomes = ShuffleOutcomes(17)
+    >>> rounds = outcomes.outcomes(bytes(range(52)))
+    >>> len(set(r[2] + r[3] for r in rounds)), len(set(r[2] for r in rounds))
+    (36, 26)
+    >>> mongean, modified_overhand, dealt, left, player, dealer, result =\\
+    ... rounds[0]
+    >>> [Card.from_code(code) for code in dealt], player, dealer, result
+    ([(2, clubs), (2, diamonds), (2, hearts), (2, spades), (3, clubs), (3, diamonds), (3, hearts), (3, spades), (4, clubs), (4, diamonds), (4, hearts), (4, spades), (5, clubs)], 20, 21, -1)
+
+    # Exact odds of the first round
+    >>> odds = outcomes.session(Deck(), 1, 100)
+    >>> sorted(odds.items())
+    [(95, Fraction(2, 9)), (100, Fraction(1, 3)), (105, Fraction(4, 9))]
+
+    # Matches Blackjack over every sequence of shuffle counts
+    >>> from itertools import product
+    >>> from os import devnull
+    >>> from summary import SummaryWriter
+    >>> counts = {}
+    >>> for sequence in product(ShuffleOutcomes.combinations, repeat = 2):
+    ...     game = Blackjack(100, Deck(), rng = 0, log_level = 'off',\\
+    ...     summary = SummaryWriter(devnull))
+    ...     game.shuffle_buffer = list(sequence)
+    ...     game.play_round(2, 17)
+    ...     counts[game.wallet] = counts.get(game.wallet, 0) + 1
+    >>> odds = outcomes.session(Deck(), 2, 100)
+    >>> odds == {wallet: Fraction(n, 36 ** 2) for wallet, n in counts.items()}
+    True
+    """
+
+    # Class Attribute(s)
+    # (mongean, modified_overhand) counts, in the order
+    # `Blackjack.shuffle_counts` returns them
+    combinations = tuple((mongean, modified_overhand)\
+    for mongean in range(6) for modified_overhand in range(6))
+
+    def __init__(self, stand_threshold):
+        """
+        Parameters:
+            stand_threshold (int): Score threshold for when the player
+            will stand, or a Strategy, as in `Blackjack.play_round`.
+        """
+        assert isinstance(stand_threshold, (int, Strategy))
+        self.strategy = Strategy.of(stand_threshold)
+        # Maps the cards left to deal (bytes of codes) to `outcomes`
+        self.cache = {}
+
+    def orders(codes):
+        """
+        Returns the order of `codes` after each shuffle in `combinations`,
+        as bytes.
+
+        >>> orders = ShuffleOutcomes.orders(bytes(range(52)))
+        >>> orders[0] == bytes(range(52)), list(orders[1][:5])
+        (True, [25, 0, 1, 2, 3])
+        """
+        return tuple([bytes([codes[i] for i in Shuffle.combined(len(codes),\
+        modified_overhand = modified_overhand, mongean = mongean)])\
+        for mongean, modified_overhand in ShuffleOutcomes.combinations])
+
+    def deal(codes, strategy):
+        """
+        Deals one round from the top of `codes` without shuffling.
+        Returns the number of cards dealt, the player's and dealer's
+        scores and the result as in `Blackjack.outcome`.
+        """
+        values = Card.values
+        upcard = values[codes[1]]
+        hard = values[codes[0]] + values[codes[2]]
+        aces = (values[codes[0]] == 1) + (values[codes[2]] == 1)
+        position = 4
+        score = PlayerHand.best_score(hard, aces)
+        while (position < len(codes)) and strategy.hits(score,\
+        int((aces > 0) & (hard + 10 * aces <= 21)), upcard):
+            hard += values[codes[position]]
+            aces += values[codes[position]] == 1
+            position += 1
+            score = PlayerHand.best_score(hard, aces)
+        player_score = score
+
+        hard = upcard + values[codes[3]]
+        aces = (upcard == 1) + (values[codes[3]] == 1)
+        score = PlayerHand.best_score(hard, aces)
+        while (position < len(codes)) and Blackjack.dealer_strategy.hits(\
+        score, int((aces > 0) & (hard + 10 * aces <= 21)), upcard):
+            hard += values[codes[position]]
+            aces += values[codes[position]] == 1
+            position += 1
+            score = PlayerHand.best_score(hard, aces)
+        return position, player_score, score,\
+        Blackjack.outcome(player_score, score)
+
+    def outcomes(self, codes):
+        """
+        Returns, for each shuffle in `combinations`, a tuple of the
+        mongean and modified overhand counts, the cards dealt and the
+        cards left (as bytes of codes), the player's and dealer's scores
+        and the result. `codes` must hold at least 4 cards.
+        """
+        codes = bytes(codes)
+        min_cards = 4
+        assert len(codes) >= min_cards
+        if codes not in self.cache:
+            rounds = []
+            for (mongean, modified_overhand), order in\
+            zip(ShuffleOutcomes.combinations, ShuffleOutcomes.orders(codes)):
+                dealt, player_score, dealer_score, result = \
+                ShuffleOutcomes.deal(order, self.strategy)
+                rounds.append((mongean, modified_overhand, order[:dealt],\
+                order[dealt:], player_score, dealer_score, result))
+            self.cache[codes] = tuple(rounds)
+        return self.cache[codes]
+
+    def session(self, deck, num_rounds, wallet, min_bet=5):
+        """
+        Returns the exact distribution of the wallet after
+        `Blackjack.play_round(num_rounds, ...)` from `deck` (a Deck), as
+        a dictionary mapping each final wallet to its probability (a
+        Fraction). Sessions that stop early, for lack of cards or money,
+        keep the wallet they stopped with.
+
+        States that reach the same cards, wallet and bet are merged, but
+        the number of card orders can still grow 36 times per round.
+        """
+        assert isinstance(num_rounds, int)
+        min_cards = 4
+        step = Fraction(1, len(ShuffleOutcomes.combinations))
+        codes = bytes([card.code for card in deck.get_cards()])
+        states = {(codes, wallet, min_bet): Fraction(1)}
+        finals = {}
+        for i in range(num_rounds):
+            following = {}
+            for (codes, wallet, bet), probability in states.items():
+                if (len(codes) < min_cards) | (wallet < bet):
+                    finals[wallet] = finals.get(wallet, 0) + probability
+                    continue
+                for round_outcome in ShuffleOutcomes.outcomes(self, codes):
+                    result = round_outcome[-1]
+                    if result == 1:
+                        state = (round_outcome[3], wallet + bet, bet + 5)
+                    elif result == -1:
+                        state = (round_outcome[3], wallet - bet,\
+                        bet - 5 if bet > 5 else bet)
+                    else:
+                        state = (round_outcome[3], wallet, bet)
+                    following[state] = following.get(state, 0) +\
+                    probability * step
+            states = following
+        for (codes, wallet, bet), probability in states.items():
+            finals[wallet] = finals.get(wallet, 0) + probability
+        return finals
@@ -0,0 +1,112 @@
+from card import Card
+
+class EventLog:
+    """
+    Append-only log of game events. Events are stored as small tuples and
+    only turned into text when `render` is called.
+
+    The level decides what is recorded: 'cards' records everything,
+    'rounds' leaves out the per-card events (deal, pull and reveal) and
+    'off' records nothing.
+
+    >>> from hand import PlayerHand
+    >>> hand = PlayerHand()
+    >>> hand.add_card(Card("A", "spades"), Card(7, "hearts"))
+    >>> log = EventLog()
+    >>> log.add('round', 1, 10, 5)
+    >>> log.add('pull', 'Player', EventLog.snapshot_card(Card(3, "clubs")))
+    >>> log.add('reveal', EventLog.snapshot(hand))
+    >>> log.add('result', -1, 18, 20)
+    >>> print(log.render())
+    Round 1 of Blackjack!
+    wallet: 10
+    bet: 5
+    Player pulled a (3, clubs)
+    Dealer Cards Revealed: (7, hearts) (A, spades)
+    Player lost with a score of 18. Dealer won with a score of 20.
+    <BLANKLINE>
+    >>> len(log), EventLog('rounds').cards, EventLog('off').rounds
+    (4, False, False)
+    """
+
+    # Class Attribute(s)
+    levels = ('off', 'rounds', 'cards')
+    # Added to a card code in a snapshot when the card is face down
+    hidden = 64
+
+    def __init__(self, level='cards'):
+        assert level in EventLog.levels
+        self.level = level
+        self.rounds = level != 'off'
+        self.cards = level == 'cards'
+        self.events = []
+
+    def add(self, *event):
+        """
+        Records an event: its kind followed by its arguments.
+        """
+        self.events.append(event)
+
+    def clear(self):
+        self.events = []
+
+    def __len__(self):
+        return len(self.events)
+
+    def snapshot_card(card):
+        return card.code if card.visible else card.code + EventLog.hidden
+
+    def snapshot(hand):
+        """
+        Returns the cards of a hand as they look right now, so the hand can
+        keep changing before the log is rendered.
+        """
+        return tuple([EventLog.snapshot_card(card)\
+        for card in hand.get_cards()])
+
+    def card_text(code):
+        if code < EventLog.hidden:
+            return Card.reprs[code]
+        return Card.hidden_repr
+
+    def hand_text(snapshot):
+        return ' '.join([EventLog.card_text(code) for code in snapshot])
+
+    def render_event(event):
+        kind = event[0]
+        if kind == 'round':
+            return 'Round {0} of Blackjack!\nwallet: {1}\nbet: {2}\n'\
+            .format(*event[1:])
+        elif kind == 'deal':
+            return 'Player Cards: {0}\nDealer Cards: {1}\n'\
+            .format(EventLog.hand_text(event[1]),\
+            EventLog.hand_text(event[2]))
+        elif kind == 'pull':
+            return '{0} pulled a {1}\n'\
+            .format(event[1], EventLog.card_text(event[2]))
+        elif kind == 'reveal':
+            return 'Dealer Cards Revealed: {0}\n'\
+            .format(EventLog.hand_text(event[1]))
+        elif kind == 'result':
+            result, player_score, dealer_score = event[1:]
+            if result == 1:
+                return \
+                'Player won with a score of {0}. Dealer lost with a score of {1}.'\
+                .format(player_score, dealer_score) + '\n'
+            elif result == -1:
+                return \
+                'Player lost with a score of {0}. Dealer won with a score of {1}.'\
+                .format(player_score, dealer_score) + '\n'
+            return 'Player and Dealer tie.\n'
+        elif kind == 'no_cards':
+            return 'Not enough cards for a game.'
+        elif kind == 'no_funds':
+            return 'Wallet amount ${0} is less than bet amount ${1}.'\
+            .format(*event[1:])
+
+    def render(self):
+        """
+        Returns the text of every recorded event, in order.
+        """
+        return ''.join([EventLog.render_event(event)\
+        for event in self.events])
@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 from card import Card
 
 class PlayerHand():
@@ -67,50 +69,107 @@ class PlayerHand():
     |__K|
     >>> d_hand
     (4, hearts) (5, spades) (K, diamonds)
+
+    # Doctests for the running score
+    >>> p_hand.score(), p_hand.is_soft(), p_hand.is_bust()
+    (16, True, False)
+    >>> p_hand.add_card(card_6)
+    >>> p_hand.score(), p_hand.is_soft(), p_hand.is_bust()
+    (16, False, False)
+    >>> p_hand.add_card(card_7)
+    >>> p_hand.score(), p_hand.is_bust()
+    (26, True)
+    >>> d_hand.score()
+    19
     """
 
     def __init__(self):
         self.cards = []
+        # `Card.sort_keys` of the cards, in the same order as `cards`
+        self.keys = []
+        self.hard_total = 0
+        self.aces = 0
 
     def add_card(self, *cards):
         """
-        Adds cards to the hand, then sorts
-        them in ascending order.
+        Adds cards to the hand, keeping them in ascending order. Each card
+        is inserted in place by bisecting the integer sort keys, so the
+        hand is never sorted again.
         """
         for card in cards:
             assert (isinstance(card.rank, int)) | isinstance(card.rank, str)
             assert isinstance(card.suit, str)
-            self.cards.append(card)
-        self.cards = self.sort_hand()
+            key = Card.sort_keys[card.code]
+            index = bisect_right(self.keys, key)
+            self.keys.insert(index, key)
+            self.cards.insert(index, card)
+            self.count_card(card)
+
+    def count_card(self, card):
+        """
+        Adds `card` to the running hard total (Aces counted as 1)
+        and Ace count.
+        """
+        self.hard_total += card.value
+        if card.value == 1:
+            self.aces += 1
 
     def get_cards(self):
         return self.cards
 
+    def score(self):
+        """
+        Returns the best score of the hand, following the rules of
+        `Blackjack.calculate_score`.
+        """
+        return PlayerHand.best_score(self.hard_total, self.aces)
+
+    def best_score(hard_total, aces):
+        """
+        Returns the score of a hand with the given hard total (Aces counted
+        as 1) and number of Aces: every Ace counts as 11 when that keeps
+        the hand at 21 or under, otherwise every Ace counts as 1, and a
+        total of 22 scores 12.
+        """
+        double_ace = 22
+        soft_total = hard_total + 10 * aces
+        if soft_total <= 21:
+            return soft_total
+        elif soft_total == double_ace:
+            return 12
+        return hard_total
+
+    def is_soft(self):
+        """
+        Returns whether the Aces in the hand are counted as 11.
+        """
+        return (self.aces > 0) & (self.hard_total + 10 * self.aces <= 21)
+
+    def is_bust(self):
+        return self.score() > 21
+
     def __str__(self):
         """
         Returns the string representation of all cards
         in the hand, with each card on a new line.
         """
-        string = ""
-        for card in self.cards:
-            string += card.__str__() + '\n'
-        return string.strip('\n')
+        return '\n'.join([Card.arts[card.code] if card.visible\
+        else Card.hidden_art for card in self.cards])
 
     def __repr__(self):
         """
         Returns the representation of all cards, with
         each card separated by a space.
         """
-        string = ""
-        for card in self.cards:
-            string += card.__repr__() + ' '
-        return string.strip(' ')
+        return ' '.join([Card.reprs[card.code] if card.visible\
+        else Card.hidden_repr for card in self.cards])
 
     def sort_hand(self):
         """
-        Sorts the cards in ascending order.
+        Returns the cards in ascending order. They are kept in order as
+        they are added, so this is only a copy.
         """
-        return sorted(self.cards)
+        return list(self.cards)
 
 
 class DealerHand(PlayerHand):
@@ -120,6 +179,10 @@ class DealerHand(PlayerHand):
         # the parent PlayerHand class.
         self.hand_visible = False
         self.cards = []
+        self.hard_total = 0
+        self.aces = 0
+        # The first card dealt, which the player sees before the reveal
+        self.upcard = None
     def add_card(self, *cards):
         """
         Adds the cards to hand such that only the first card
@@ -132,8 +195,17 @@ class DealerHand(PlayerHand):
             assert isinstance(card.suit, str)
             card.visible = False
             self.cards.append(card)
+            self.count_card(card)
         self.cards[0].visible = True
+        self.upcard = self.cards[0]
+
 
+    def sort_hand(self):
+        """
+        Returns the cards sorted in ascending order. The dealer's cards
+        stay in the order they were dealt until `reveal_hand`.
+        """
+        return sorted(self.cards, key = lambda card: Card.sort_keys[card.code])
 
     def reveal_hand(self):
         """
@@ -0,0 +1,109 @@
+import json
+from time import monotonic, perf_counter_ns
+
+class Instruments:
+    """
+    Call counts and cumulative nanoseconds for the phases of
+    `Blackjack.play_round`, plus counters for the cards dealt, the
+    shuffles and the rounds played.
+
+    Nothing is timed unless a game is given an Instruments instance: the
+    deck's `shuffle` and `deal_hand` and the log's `add` are only wrapped
+    (see `wrap`) when one is, and `play_round` only reads the clock then.
+
+    Phases nest: 'round' covers a whole round, 'hit' includes the cards
+    it deals, and 'shuffle', 'deal' and 'log' are also counted in the
+    phase that called them.
+
+    >>> from blackjack import Blackjack
+    >>> from deck import Shoe
+    >>> instruments = Instruments()
+    >>> game = Blackjack(10 ** 6, Shoe(2), rng=1, instruments=instruments)
+    >>> game.play_round(10, 17)
+    >>> stats = game.stats()
+    >>> sorted(stats['phases'])
+    ['deal', 'hit', 'log', 'round', 'score', 'shuffle', 'summary']
+    >>> stats['phases']['round']['calls'], stats['counts']['rounds']
+    (10, 10)
+    >>> stats['counts']['shuffles'] == stats['phases']['shuffle']['calls']
+    True
+    >>> stats['counts']['cards_dealt'] >= 40
+    True
+    >>> stats['phases']['hit']['ns'] > 0
+    True
+    >>> Blackjack(10).stats()
+    {}
+    """
+
+    # Class Attribute(s)
+
+    def __init__(self, dump_path=None, dump_seconds=60.0):
+        """
+        Parameters:
+            dump_path (str): File that `stats` is appended to as one line
+            of JSON every `dump_seconds`, checked after each round. None
+            disables the dump.
+            dump_seconds (float): Seconds between dumps.
+        """
+        self.dump_path = dump_path
+        self.dump_seconds = dump_seconds
+        self.last_dump = monotonic()
+        Instruments.reset(self)
+
+    def reset(self):
+        # Maps a phase to [calls, nanoseconds]
+        self.phases = {}
+        self.counts = {'cards_dealt': 0, 'shuffles': 0, 'rounds': 0}
+
+    def record(self, phase, start):
+        """
+        Adds one call of `phase` that started at `start` (from
+        `perf_counter_ns`) and returns the time it ended.
+        """
+        now = perf_counter_ns()
+        if phase not in self.phases:
+            self.phases[phase] = [0, 0]
+        totals = self.phases[phase]
+        totals[0] += 1
+        totals[1] += now - start
+        return now
+
+    def wrap(self, target, method, phase, count=None):
+        """
+        Replaces `method` on the `target` instance with a version that is
+        recorded as `phase` and adds one to `counts[count]` per call.
+        """
+        function = getattr(target, method)
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            result = function(*args, **kwargs)
+            Instruments.record(self, phase, start)
+            if count is not None:
+                self.counts[count] += 1
+            return result
+        setattr(target, method, timed)
+
+    def tick(self):
+        """
+        Counts a finished round and dumps the stats if they are due.
+        """
+        self.counts['rounds'] += 1
+        if (self.dump_path is not None) and \
+        (monotonic() - self.last_dump >= self.dump_seconds):
+            Instruments.dump(self)
+
+    def stats(self):
+        """
+        Returns the counts and, for each phase, its calls, total and mean
+        nanoseconds.
+        """
+        phases = {}
+        for phase, (calls, ns) in self.phases.items():
+            phases[phase] = {'calls': calls, 'ns': ns, 'mean_ns': ns / calls}
+        return {'phases': phases, 'counts': dict(self.counts)}
+
+    def dump(self):
+        with open(self.dump_path, 'a', encoding = 'utf-8') as f:
+            f.write(json.dumps(Instruments.stats(self), sort_keys = True)\
+            + '\n')
+        self.last_dump = monotonic()
@@ -0,0 +1,185 @@
+from blackjack import Blackjack
+from card import Card
+from strategy import Strategy
+
+import numpy as np
+
+class MonteCarlo:
+    """
+    Batched Monte Carlo evaluator for `stand_threshold` strategies.
+
+    Many independently shuffled decks ("shoes") are held in one
+    (shoes x 52) integer array of card codes, where code `i` is the card
+    at position `i` of a fresh `Deck()` (ranks 2..A, suits clubs,
+    diamonds, hearts, spades). One round is dealt from the top of every
+    shoe at once, in the same order as `Blackjack.play_round`.
+
+    # Scores agree with Blackjack.calculate_score, quirks included
+    >>> from hand import PlayerHand
+    >>> hand = PlayerHand()
+    >>> hand.add_card(Card(10, "clubs"), Card(10, "spades"), Card(2, "clubs"))
+    >>> Blackjack.calculate_score(hand)
+    12
+    >>> MonteCarlo.score(np.array([22]), np.array([0])).tolist()
+    [12]
+    >>> hard, aces = np.array([2, 11, 12, 22]), np.array([2, 1, 1, 0])
+    >>> MonteCarlo.score(hard, aces).tolist()
+    [12, 21, 12, 12]
+
+    >>> shoes = np.array([np.arange(52)[::-1], np.arange(52)])
+    >>> MonteCarlo.results(shoes, 17).tolist()
+    [0, -1]
+
+    >>> mc = MonteCarlo(seed = 7)
+    >>> table = mc.evaluate(2000, range(12, 22), batch_size = 500)
+    >>> sorted(table) == list(range(12, 22))
+    True
+    >>> ev, variance = table[15]
+    >>> -1 <= ev <= 1 and 0 <= variance <= 1
+    True
+    >>> mc.evaluate(2000, [15], batch_size = 2000, seed = 7)[15] == \\
+    ... MonteCarlo(seed = 7).evaluate(2000, [15], batch_size = 2000)[15]
+    True
+
+    # Strategies are looked up for the whole batch at once
+    >>> from strategy import TableStrategy
+    >>> basic, sixteen = TableStrategy.basic(), TableStrategy.from_threshold(16)
+    >>> table = mc.evaluate(2000, [16, sixteen, basic], seed = 3)
+    >>> table[16] == table[sixteen]
+    True
+    """
+
+    # Class Attribute(s)
+    deck_size = 52
+    ace_code = 48
+    values = np.array(Card.values, dtype = np.int16)
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
+    def shoes(self, num_shoes):
+        """
+        Returns a (num_shoes x 52) array of independently shuffled decks.
+        """
+        assert isinstance(num_shoes, int)
+        ordered = np.tile(np.arange(MonteCarlo.deck_size, dtype = np.int8),
+                          (num_shoes, 1))
+        return self.rng.permuted(ordered, axis = 1)
+
+    def score(hard, aces):
+        """
+        Vectorized `Blackjack.calculate_score`.
+
+        Parameters:
+            hard: totals of each hand counting every Ace as 1.
+            aces: number of Aces in each hand.
+        Returns:
+            Every Ace counts as 11 when that keeps the hand at 21 or
+            under, otherwise every Ace counts as 1. A 22 always scores 12.
+        """
+        double_ace = 22
+        soft = hard + 10 * aces
+        return np.where(soft <= 21, soft,
+                        np.where(soft == double_ace, 12, hard))
+
+    def hits(strategy, hard, aces, upcards):
+        """
+        Vectorized `Strategy.hit`: returns where each hand takes a card.
+        """
+        soft = ((aces > 0) & (hard + 10 * aces <= 21)).astype(np.int8)
+        return strategy.hits(MonteCarlo.score(hard, aces), soft, upcards)
+
+    def draw(shoes, position, hard, aces, stand_threshold, upcards):
+        """
+        Keeps dealing the next card of each shoe into its hand while the
+        hand scores below `stand_threshold` (or while a Strategy says to
+        hit against `upcards`, the dealer's upcard values). `position`,
+        `hard` and `aces` are updated in place.
+        """
+        strategy = Strategy.of(stand_threshold)
+        rows = np.arange(len(shoes))
+        active = MonteCarlo.hits(strategy, hard, aces, upcards)
+        active &= position < MonteCarlo.deck_size
+        while active.any():
+            index = rows[active]
+            cards = shoes[index, position[index]]
+            hard[index] += MonteCarlo.values[cards]
+            aces[index] += cards >= MonteCarlo.ace_code
+            position[index] += 1
+            active[index] = MonteCarlo.hits(strategy, hard[index],\
+            aces[index], upcards[index])\
+            & (position[index] < MonteCarlo.deck_size)
+
+    def results(shoes, stand_threshold):
+        """
+        Plays one round from the top of every shoe. `stand_threshold`
+        can also be a Strategy.
+
+        Returns:
+            An int8 vector with 1 where the player won, 0 for a tie and
+            -1 where the dealer won (see `Blackjack.outcome`).
+        """
+        threshold = 21
+        values = MonteCarlo.values[shoes[:, :4]]
+        aces = (shoes[:, :4] >= MonteCarlo.ace_code).astype(np.int16)
+        player_hard = values[:, 0] + values[:, 2]
+        player_aces = aces[:, 0] + aces[:, 2]
+        dealer_hard = values[:, 1] + values[:, 3]
+        dealer_aces = aces[:, 1] + aces[:, 3]
+        position = np.full(len(shoes), 4)
+        upcards = values[:, 1]
+
+        MonteCarlo.draw(shoes, position, player_hard, player_aces,\
+        stand_threshold, upcards)
+        MonteCarlo.draw(shoes, position, dealer_hard, dealer_aces,\
+        Blackjack.dealer_strategy, upcards)
+
+        player = MonteCarlo.score(player_hard, player_aces)
+        dealer = MonteCarlo.score(dealer_hard, dealer_aces)
+        sign = np.sign(player - dealer)
+        return np.select(
+            [(player == threshold) & (dealer != threshold),
+             (player > threshold) & (dealer < threshold),
+             (player < threshold) & (dealer > threshold),
+             (player == dealer) | ((player > threshold) & \
+             (dealer > threshold))],
+            [1, -1, 1, 0], sign).astype(np.int8)
+
+    def evaluate(self, num_hands, thresholds=range(12, 22),
+                 batch_size=100000, seed=None):
+        """
+        Plays `num_hands` rounds for every stand threshold, each round on a
+        freshly shuffled shoe. All thresholds see the same shoes.
+
+        Parameters:
+            num_hands (int): Number of rounds per threshold.
+            thresholds: Stand thresholds (or Strategy instances) to
+            evaluate.
+            batch_size (int): Number of shoes held in memory at once.
+            seed: Optional seed to restart the random stream with.
+        Returns:
+            A dictionary mapping each threshold to a tuple of the expected
+            value and the variance of a round's result, in units of the bet.
+        """
+        assert isinstance(num_hands, int)
+        assert isinstance(batch_size, int)
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        thresholds = list(thresholds)
+        totals = {t: 0 for t in thresholds}
+        squares = {t: 0 for t in thresholds}
+
+        remaining = num_hands
+        while remaining > 0:
+            shoes = self.shoes(min(batch_size, remaining))
+            for t in thresholds:
+                results = MonteCarlo.results(shoes, t)
+                totals[t] += int(results.sum(dtype = np.int64))
+                squares[t] += int(np.count_nonzero(results))
+            remaining -= len(shoes)
+
+        table = {}
+        for t in thresholds:
+            ev = totals[t] / num_hands
+            table[t] = (ev, squares[t] / num_hands - ev ** 2)
+        return table
@@ -0,0 +1,155 @@
+from os import path
+from struct import Struct
+from time import monotonic
+
+from card import Card
+from hand import PlayerHand, DealerHand
+from summary import SummaryWriter
+
+import numpy as np
+
+class RecordWriter(SummaryWriter):
+    """
+    Writes rounds as fixed-size binary records instead of summary text.
+    Can be passed to `Blackjack` in place of a SummaryWriter.
+
+    Each record holds the round number, the wallet after the round, the
+    bet played in it, the codes of the player's and dealer's cards (see
+    `Card.from_code`, plus 64 for a card that is face down, padded with
+    255) in the order they are held, both scores and the result (1 player
+    won, 0 tie, -1 dealer won). Buffering works as in SummaryWriter.
+
+    >>> from tempfile import TemporaryDirectory
+    >>> from blackjack import Blackjack
+    >>> folder = TemporaryDirectory()
+    >>> name = folder.name + "/game2.rounds"
+    >>> with RecordWriter(name) as writer:
+    ...     game = Blackjack(100, rng=3, summary=writer)
+    ...     game.play_round(6, 16)
+    >>> len(open(name, 'rb').read()) == 6 * RecordWriter.record.size
+    True
+    >>> reader = RecordReader(name)
+    >>> len(reader)
+    6
+    >>> records = reader.records()
+    >>> records['round'].tolist()
+    [1, 2, 3, 4, 5, 6]
+    >>> int(records['wallet'][-1]) == game.wallet
+    True
+    >>> from simulation import Simulation
+    >>> played = Simulation(100, rng=3).play_round(6, 16)['bet']
+    >>> records['bet'].tolist() == played.tolist()
+    True
+    >>> first = next(iter(reader))
+    >>> int(first['player_score']), RecordReader.cards(first['player_cards'])
+    (21, [(5, clubs), (6, spades), (K, clubs)])
+
+    # The text summary can be regenerated from the records
+    >>> text = name + ".txt"
+    >>> with SummaryWriter(text) as writer:
+    ...     game = Blackjack(100, rng=3, summary=writer)
+    ...     game.play_round(6, 16)
+    >>> reader.to_text() == open(text, encoding = 'utf-8').read()
+    True
+    >>> folder.cleanup()
+    """
+
+    # Class Attribute(s)
+    max_cards = 24
+    hidden = 64
+    empty = 255
+    # round, wallet, bet, player cards, dealer cards, player score,
+    # dealer score, result
+    record = Struct('<Iqq24s24sBBb')
+    dtype = np.dtype([('round', '<u4'), ('wallet', '<i8'), ('bet', '<i8'),
+                      ('player_cards', 'u1', (24,)),
+                      ('dealer_cards', 'u1', (24,)),
+                      ('player_score', 'u1'), ('dealer_score', 'u1'),
+                      ('result', 'i1')])
+    results = {'Player': 1, 'Tied': 0, 'Dealer': -1}
+
+    def encode_cards(hand):
+        cards = bytes([card.code if card.visible else\
+        card.code + RecordWriter.hidden for card in hand.get_cards()])
+        assert len(cards) <= RecordWriter.max_cards
+        return cards.ljust(RecordWriter.max_cards, bytes([RecordWriter.empty]))
+
+    def write_round(self, round_number, player_hand, dealer_hand, result,
+                    wallet=0, bet=0):
+        self.write(RecordWriter.record.pack(round_number, wallet, bet,\
+        RecordWriter.encode_cards(player_hand),\
+        RecordWriter.encode_cards(dealer_hand),\
+        player_hand.score(), dealer_hand.score(),\
+        RecordWriter.results[result]))
+
+    def flush(self):
+        """
+        Writes every buffered record to the file.
+        """
+        if self.buffer:
+            if self.file is None:
+                self.file = open(self.path, 'ab')
+            self.file.write(b''.join(self.buffer))
+            self.file.flush()
+            self.buffer = []
+            self.buffered = 0
+        self.last_flush = monotonic()
+
+
+class RecordReader:
+    """
+    Reads a file written by RecordWriter through a read-only memory map.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def records(self):
+        """
+        Returns all records as a structured NumPy array (memory-mapped
+        unless the file is empty).
+        """
+        if path.getsize(self.path) == 0:
+            return np.zeros(0, dtype = RecordWriter.dtype)
+        return np.memmap(self.path, dtype = RecordWriter.dtype, mode = 'r')
+
+    def __len__(self):
+        return path.getsize(self.path) // RecordWriter.record.size
+
+    def chunks(self, size=65536):
+        """
+        Yields the records as consecutive arrays of at most `size` records.
+        """
+        records = self.records()
+        for start in range(0, len(records), size):
+            yield records[start:start + size]
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+    def cards(codes):
+        """
+        Returns the cards encoded in a padded row of card codes, in order.
+        """
+        return [Card.from_code(int(code) % RecordWriter.hidden,\
+        code < RecordWriter.hidden) for code in codes\
+        if code != RecordWriter.empty]
+
+    def to_text(self):
+        """
+        Returns the text that `Blackjack.add_to_file` would have written
+        for the same rounds.
+        """
+        labels = {1: 'Player', 0: 'Tied', -1: 'Dealer'}
+        text = []
+        for record in self:
+            # The cards are kept exactly as they were held, face down
+            # dealer cards included, rather than dealt again
+            player_hand = PlayerHand()
+            player_hand.cards = RecordReader.cards(record['player_cards'])
+            dealer_hand = DealerHand()
+            dealer_hand.cards = RecordReader.cards(record['dealer_cards'])
+            text.append(SummaryWriter.format_round(int(record['round']),\
+            player_hand, dealer_hand, labels[int(record['result'])]))
+        return ''.join(text)
@@ -0,0 +1,42 @@
+class RoundResult:
+    """
+    Outcome of one round, as yielded by `Blackjack.iter_rounds`.
+
+    Holds the two hands of the round (a game starts new hands every
+    round, so they are not changed afterwards), both scores, the result
+    (1 if the player won, 0 for a tie and -1 if the dealer won), the bet
+    that was played and the wallet once it was settled.
+
+    >>> from hand import PlayerHand, DealerHand
+    >>> outcome = RoundResult(3, PlayerHand(), DealerHand(), 20, 22, 1, 5, 15)
+    >>> outcome.winner
+    'Player'
+    >>> outcome
+    RoundResult(round=3, player_score=20, dealer_score=22, winner=Player, bet=5, wallet=15)
+    """
+
+    # Class Attribute(s)
+    __slots__ = ('round', 'player_hand', 'dealer_hand', 'player_score',
+                 'dealer_score', 'result', 'bet', 'wallet')
+    winners = {1: 'Player', 0: 'Tied', -1: 'Dealer'}
+
+    def __init__(self, round_number, player_hand, dealer_hand, player_score,
+                 dealer_score, result, bet, wallet):
+        self.round = round_number
+        self.player_hand = player_hand
+        self.dealer_hand = dealer_hand
+        self.player_score = player_score
+        self.dealer_score = dealer_score
+        self.result = result
+        self.bet = bet
+        self.wallet = wallet
+
+    @property
+    def winner(self):
+        return RoundResult.winners[self.result]
+
+    def __repr__(self):
+        return 'RoundResult(round={0}, player_score={1}, dealer_score={2},'\
+        .format(self.round, self.player_score, self.dealer_score) +\
+        ' winner={0}, bet={1}, wallet={2})'\
+        .format(self.winner, self.bet, self.wallet)
@@ -0,0 +1,326 @@
+import asyncio
+import json
+import sys
+from os import devnull
+from time import perf_counter
+
+from blackjack import Blackjack
+from deck import Shoe
+from summary import SummaryWriter
+
+import numpy as np
+
+class Pipe:
+    """
+    One direction of an in-process connection, with the parts of the
+    asyncio stream API that TableServer and LoadGenerator use. Lets many
+    tables share one event loop without opening a socket per player.
+    """
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+
+    async def readline(self):
+        return await self.queue.get()
+
+    def write(self, data):
+        self.queue.put_nowait(data)
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.queue.put_nowait(b'')
+
+    async def wait_closed(self):
+        pass
+
+
+class Table:
+    """
+    One Blackjack game whose player is asked for every hit instead of
+    following a `stand_threshold`. Rounds go through the same
+    `Blackjack.start_round` and `Blackjack.finish_round` as
+    `Blackjack.play_round`; only the player's decisions differ, and the
+    player is not asked once the hand is bust.
+
+    >>> from os import devnull
+    >>> from summary import SummaryWriter
+    >>> async def stand_on_17(hand, upcard):
+    ...     return hand.score() < 17
+    >>> table = Table(Blackjack(100, rng=7, summary=SummaryWriter(devnull)))
+    >>> asyncio.run(table.play_round(stand_on_17))
+    0
+    >>> reference = Blackjack(100, rng=7, summary=SummaryWriter(devnull))
+    >>> reference.play_round(1, 17)
+    >>> table.game.get_log() == reference.get_log()
+    True
+
+    # A game without a summary writer writes its summary to os.devnull
+    >>> import os
+    >>> from tempfile import TemporaryDirectory
+    >>> here = os.getcwd()
+    >>> with TemporaryDirectory() as folder:
+    ...     os.chdir(folder)
+    ...     try:
+    ...         bare = Table(Blackjack(100, rng=1))
+    ...         result = asyncio.run(bare.play_round(stand_on_17))
+    ...         written = os.listdir(folder)
+    ...     finally:
+    ...         os.chdir(here)
+    >>> result in (-1, 0, 1), written, bare.game.summary.path == devnull
+    (True, [], True)
+    """
+
+    def __init__(self, game):
+        """
+        Parameters:
+            game (Blackjack): Game played at the table. Without a
+            `summary` writer it is given one that writes to os.devnull.
+        """
+        self.game = game
+        if game.summary is None:
+            game.summary = SummaryWriter(devnull)
+        self.status = 'completed'
+
+    async def play_round(self, decide):
+        """
+        Plays one round, awaiting `decide(player_hand, upcard)` for each
+        decision (True to hit). Returns the result as in
+        `Blackjack.determine_winner`, or None when the round cannot be
+        played; `status` then says why.
+        """
+        game = self.game
+        if not Blackjack.start_round(game):
+            self.status = game.status
+            return None
+        player_hand = game.player_hand
+        upcard = game.dealer_hand.upcard
+        while game.deck.has_cards() and (not player_hand.is_bust())\
+        and await decide(player_hand, upcard):
+            Blackjack.pull(game, player_hand)
+        return Blackjack.finish_round(game).result
+
+
+class TableServer:
+    """
+    Runs one Table per connected player, all in one event loop. Players
+    connect over a local TCP socket (`start`) or an in-process pipe
+    (`connect_local`) and speak one JSON object per line:
+
+        player: {"wallet": 100, "rounds": 10, "seed": 1}
+        server: {"type": "decide", "score": 15, "soft": false, "upcard": 10}
+        player: {"hit": true}
+        server: {"type": "result", "result": 1, "wallet": 105}
+        server: {"type": "done", "rounds": 10, "status": "completed"}
+
+    A player that disconnects or sends a line that is not a valid
+    message has its connection closed and is counted in `errors`.
+
+    >>> report = LoadGenerator(20, 5).run_local()
+    >>> report['players'], report['rounds'], report['decisions'] > 0
+    (20, 100, True)
+    >>> report = LoadGenerator(5, 3).run_tcp()
+    >>> report['rounds'], report['p50_ms'] <= report['p99_ms']
+    (15, True)
+
+    >>> async def misbehave(server):
+    ...     reader, writer = server.connect_local()
+    ...     writer.write(b'not json\\n')
+    ...     garbled = await reader.readline()
+    ...     reader, writer = server.connect_local()
+    ...     writer.write(b'{"wallet": 100, "rounds": 5, "seed": 1}\\n')
+    ...     await reader.readline()
+    ...     writer.close()
+    ...     while await reader.readline():
+    ...         pass
+    ...     return garbled
+    >>> server = TableServer()
+    >>> asyncio.run(misbehave(server))
+    b''
+    >>> server.tables, server.errors
+    (0, 2)
+    """
+
+    def __init__(self, num_decks=6, log_level='off'):
+        """
+        Parameters:
+            num_decks (int): Decks in the Shoe of each table.
+            log_level (str): `log_level` of each table's game. Tables are
+            long-lived, so the log is off by default.
+        """
+        self.num_decks = num_decks
+        self.log_level = log_level
+        self.tables = 0
+        self.rounds = 0
+        self.errors = 0
+        self.server = None
+
+    async def handle(self, reader, writer):
+        """
+        Plays the rounds requested by one player over `reader`/`writer`.
+        An empty line means the player has disconnected.
+        """
+        self.tables += 1
+        summary = SummaryWriter(devnull)
+        try:
+            line = await reader.readline()
+            if not line:
+                return None
+            request = json.loads(line)
+            game = Blackjack(request['wallet'], Shoe(self.num_decks),\
+            rng = request.get('seed'), summary = summary,\
+            log_level = self.log_level)
+            table = Table(game)
+
+            async def decide(hand, upcard):
+                writer.write(json.dumps({'type': 'decide',\
+                'score': hand.score(), 'soft': bool(hand.is_soft()),\
+                'upcard': upcard.value}).encode() + b'\n')
+                await writer.drain()
+                line = await reader.readline()
+                if not line:
+                    raise ConnectionResetError('player disconnected')
+                return json.loads(line)['hit']
+
+            played = 0
+            for i in range(request['rounds']):
+                result = await table.play_round(decide)
+                if result is None:
+                    break
+                played += 1
+                self.rounds += 1
+                writer.write(json.dumps({'type': 'result', 'result': result,\
+                'wallet': game.wallet}).encode() + b'\n')
+            writer.write(json.dumps({'type': 'done', 'rounds': played,\
+            'status': table.status}).encode() + b'\n')
+            await writer.drain()
+        except (ConnectionError, ValueError, KeyError, TypeError):
+            self.errors += 1
+        finally:
+            summary.close()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.tables -= 1
+
+    async def start(self, host='127.0.0.1', port=0):
+        """
+        Starts accepting players on a local TCP socket and returns the
+        port (a free one when `port` is 0).
+        """
+        self.server = await asyncio.start_server(self.handle, host, port,\
+        limit = 2 ** 16, backlog = 4096)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    def connect_local(self):
+        """
+        Starts a table for an in-process player and returns its
+        (reader, writer) pair.
+        """
+        to_server, to_player = Pipe(), Pipe()
+        asyncio.get_running_loop().create_task(\
+        TableServer.handle(self, to_server, to_player))
+        return to_player, to_server
+
+
+class LoadGenerator:
+    """
+    Simulated players for a TableServer. Every player stands on
+    `stand_threshold` and measures each decision's latency: the time
+    from sending its answer to receiving the server's next message.
+    """
+
+    def __init__(self, players, rounds, stand_threshold=17, wallet=10 ** 6):
+        assert isinstance(players, int)
+        assert isinstance(rounds, int)
+        self.players = players
+        self.rounds = rounds
+        self.stand_threshold = stand_threshold
+        self.wallet = wallet
+
+    async def player(self, reader, writer, seed, latencies):
+        """
+        Plays one player's rounds and returns how many were played.
+        """
+        writer.write(json.dumps({'wallet': self.wallet,\
+        'rounds': self.rounds, 'seed': seed}).encode() + b'\n')
+        await writer.drain()
+        sent = None
+        while True:
+            message = json.loads(await reader.readline())
+            if sent is not None:
+                latencies.append(perf_counter() - sent)
+                sent = None
+            if message['type'] == 'decide':
+                hit = message['score'] < self.stand_threshold
+                writer.write(json.dumps({'hit': hit}).encode() + b'\n')
+                await writer.drain()
+                sent = perf_counter()
+            elif message['type'] == 'done':
+                writer.close()
+                return message['rounds']
+
+    async def run(self, connect):
+        """
+        Runs every player at once, each connected by awaiting
+        `connect()`, and returns the report.
+        """
+        latencies = []
+        start = perf_counter()
+        connections = [await connect() for i in range(self.players)]
+        played = await asyncio.gather(*[LoadGenerator.player(self, reader,\
+        writer, seed, latencies) for seed, (reader, writer)\
+        in enumerate(connections)])
+        seconds = perf_counter() - start
+        if latencies:
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        else:
+            p50 = p99 = 0.0
+        return {'players': self.players, 'rounds': sum(played),
+                'seconds': seconds, 'rounds_per_second': sum(played) / seconds,
+                'decisions': len(latencies), 'p50_ms': float(p50),
+                'p99_ms': float(p99)}
+
+    def run_local(self, server=None):
+        """
+        Runs the players against an in-process TableServer.
+        """
+        async def main():
+            local = TableServer() if server is None else server
+            async def connect():
+                return local.connect_local()
+            return await LoadGenerator.run(self, connect)
+        return asyncio.run(main())
+
+    def run_tcp(self, server=None):
+        """
+        Runs the players against a TableServer on a local TCP socket.
+        """
+        async def main():
+            local = TableServer() if server is None else server
+            port = await local.start()
+            async def connect():
+                return await asyncio.open_connection('127.0.0.1', port)
+            try:
+                return await LoadGenerator.run(self, connect)
+            finally:
+                await local.close()
+        return asyncio.run(main())
+
+
+if __name__ == '__main__':
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    generator = LoadGenerator(players, rounds)
+    for name, run in (('local', generator.run_local),\
+    ('tcp', generator.run_tcp)):
+        print(name, json.dumps(run(), sort_keys = True))
@@ -16,8 +16,34 @@ class Shuffle:
     51
     >>> mongean_shuffle[26]
     25
+
+    # Doctests for the cached permutations
+    >>> order = Shuffle.permutation('mongean', 52, 3)
+    >>> [cards[i] for i in order] == \\
+    ... Shuffle.mongean(Shuffle.mongean(Shuffle.mongean(cards)))
+    True
+    >>> order = Shuffle.combined(52, modified_overhand=2, mongean=12)
+    >>> [cards[i] for i in order] == Shuffle.modified_overhand(cards, 2)
+    True
+    >>> len(Shuffle.mongean(list(range(5000))))
+    5000
+
+    # With 5 cards or fewer the modified overhand repeats some cards, and
+    # the mongean shuffles then work on the longer deck
+    >>> small = [10, 11, 12]
+    >>> Shuffle.modified_overhand(small, 2)
+    [11, 10, 10, 11, 12]
+    >>> order = Shuffle.combined(3, modified_overhand=2, mongean=1)
+    >>> [small[i] for i in order] == \\
+    ... Shuffle.mongean(Shuffle.modified_overhand(small, 2))
+    True
     """
 
+    # Class Attribute(s)
+    # Maps (shuffle kind, deck size, count) to a tuple of indices such that
+    # the shuffled deck is [cards[i] for i in permutation].
+    permutations = {}
+
     def modified_overhand(cards, num):
         """
         Takes `num` cards from the middle of the deck and puts them at the
@@ -69,11 +95,57 @@ class Shuffle:
         + Shuffle.shuff(cards[increment:])
 
     def shuff(cards):
+        """
+        Takes every other card starting from the top. An odd number of
+        cards is laid down in reverse order.
+        """
         even = 2
-        if len(cards) == 0:
-            return []
+        if len(cards) % even == 0:
+            return cards[::even]
         else:
-            if len(cards) % even == 0:
-                return [cards[0]] + Shuffle.shuff(cards[even:])
+            return cards[::even][::-1]
+
+    def permutation(kind, size, count):
+        """
+        Returns the permutation of a deck of `size` cards performed by
+        `Shuffle.modified_overhand(cards, count)` when `kind` is
+        'modified_overhand', or by `count` mongean shuffles when `kind` is
+        'mongean'. Results are cached in `Shuffle.permutations`.
+        """
+        assert (kind == 'modified_overhand') | (kind == 'mongean')
+        key = (kind, size, count)
+        if key not in Shuffle.permutations:
+            if count == 0:
+                order = tuple(range(size))
+            elif kind == 'modified_overhand':
+                order = tuple(Shuffle.modified_overhand(list(range(size)),\
+                count))
+            elif count == 1:
+                order = tuple(Shuffle.mongean(list(range(size))))
             else:
-                return Shuffle.shuff(cards[even:]) + [cards[0]]
+                order = Shuffle.compose(\
+                Shuffle.permutation(kind, size, count - 1),\
+                Shuffle.permutation(kind, size, 1))
+            Shuffle.permutations[key] = order
+        return Shuffle.permutations[key]
+
+    def compose(first, second):
+        """
+        Returns the permutation that applies `first` and then `second`.
+        """
+        return tuple([first[i] for i in second])
+
+    def combined(size, modified_overhand=0, mongean=0):
+        """
+        Returns the permutation of a modified overhand shuffle followed by
+        `mongean` mongean shuffles, as done by `Deck.shuffle`. The
+        modified overhand can return more than `size` indices on small
+        decks, so the mongean shuffles are sized for its result.
+        """
+        key = ('combined', size, (modified_overhand, mongean))
+        if key not in Shuffle.permutations:
+            overhand = Shuffle.permutation('modified_overhand', size,\
+            modified_overhand)
+            Shuffle.permutations[key] = Shuffle.compose(overhand,\
+            Shuffle.permutation('mongean', len(overhand), mongean))
+        return Shuffle.permutations[key]
@@ -0,0 +1,116 @@
+from blackjack import Blackjack
+from strategy import Strategy
+from summary import NullWriter
+
+from numpy import array, int8, int64
+
+class Simulation(Blackjack):
+    """
+    Headless Blackjack for large batches of rounds. Plays the rounds of
+    `Blackjack.iter_rounds`, with the log off and a NullWriter for the
+    summary, so nothing is written. Instead every round is recorded as
+    one entry in a set of compact integer arrays.
+
+    >>> from numpy.random import seed
+    >>> seed(20)
+    >>> game = Blackjack(10)
+    >>> game.play_round(4, 21)
+    >>> seed(20)
+    >>> sim = Simulation(10)
+    >>> outcomes = sim.play_round(4, 21)
+    >>> outcomes['result'].tolist()
+    [1, 1, -1, 0]
+    >>> outcomes['wallet'].tolist()
+    [10, 15, 25, 10]
+    >>> outcomes['bet'].tolist()
+    [5, 10, 15, 10]
+    >>> outcomes['player_score'].tolist()
+    [21, 21, 25, 28]
+    >>> outcomes['dealer_score'].tolist()
+    [17, 22, 20, 26]
+    >>> (sim.wallet, sim.min_bet, sim.rounds) == \\
+    ... (game.wallet, game.min_bet, game.rounds)
+    True
+    >>> sim.get_log()
+    ''
+    >>> sim.status
+    'completed'
+
+    >>> seed(20)
+    >>> short = Simulation(5)
+    >>> short.play_round(5, 21)['result'].tolist()
+    [1, 1, -1]
+    >>> short.status, short.wallet, short.min_bet
+    ('insufficient_funds', 5, 10)
+
+    # A shoe is reshuffled at the cut card instead of running out
+    >>> from deck import Shoe
+    >>> shoe = Shoe(8, penetration=0.75, mongean=3, modified_overhand=2)
+    >>> long_run = Simulation(10 ** 6, shoe)
+    >>> len(long_run.play_round(1000, 17)['result']), long_run.status
+    (1000, 'completed')
+    >>> shoe.reshuffles > 0
+    True
+
+    # Even when the cut card is at the very end of the shoe
+    >>> deep = Simulation(10 ** 6, Shoe(1, penetration=1.0), rng=1)
+    >>> len(deep.play_round(2000, 17)['result']), deep.status
+    (2000, 'completed')
+
+    # A counter sizes each bet from the true count
+    >>> from counter import CardCounter
+    >>> counted = Simulation(10 ** 6, Shoe(6), rng=2,\\
+    ... counter=CardCounter(spread=4))
+    >>> bets = counted.play_round(200, 17)['bet']
+    >>> int(bets.min()), int(bets.max())
+    (5, 20)
+
+    # Independent generators give reproducible games
+    >>> Simulation(100, rng=5).play_round(8, 16)['result'].tolist() == \\
+    ... Simulation(100, rng=5).play_round(8, 16)['result'].tolist()
+    True
+    """
+
+    # Class Attribute(s)
+    fields = ('round', 'wallet', 'bet', 'player_score', 'dealer_score',
+              'result')
+
+    def __init__(self, wallet, deck=None, rng=None, counter=None,
+                 instruments=None):
+        super().__init__(wallet, deck, rng, NullWriter(), 'off', counter,\
+        instruments)
+
+    def play_round(self, num_rounds, stand_threshold):
+        """
+        Plays up to `num_rounds` rounds and returns a dictionary mapping
+        each name in `Simulation.fields` to an integer array with one
+        entry per round played. `wallet` and `bet` hold the values at the
+        start of the round, `result` is 1, 0 or -1 as returned by
+        `Blackjack.determine_winner`.
+
+        Stops early under the same conditions as `Blackjack.play_round`;
+        `status` is then set to 'not_enough_cards' or 'insufficient_funds'.
+
+        Parameters:
+            num_rounds (int): Number of rounds to play.
+            stand_threshold (int): Score threshold for when the player
+            will stand, or a Strategy.
+        """
+        assert isinstance(num_rounds, int)
+        assert isinstance(stand_threshold, (int, Strategy))
+
+        self.status = 'completed'
+        columns = {name: [] for name in Simulation.fields}
+        for round_result in Blackjack.iter_rounds(self, num_rounds,\
+        stand_threshold):
+            columns['round'].append(round_result.round)
+            columns['wallet'].append(round_result.wallet -\
+            round_result.result * round_result.bet)
+            columns['bet'].append(round_result.bet)
+            columns['player_score'].append(round_result.player_score)
+            columns['dealer_score'].append(round_result.dealer_score)
+            columns['result'].append(round_result.result)
+
+        small = ('player_score', 'dealer_score', 'result')
+        return {name: array(values, dtype = int8 if name in small else int64)
+                for name, values in columns.items()}
@@ -0,0 +1,132 @@
+from blackjack import Blackjack
+from dealer import DealerOdds
+from hand import PlayerHand
+
+class Solver:
+    """
+    Exact expected value of a round for each `stand_threshold`, dealt from
+    a random ordering of the given cards (for example `Deck.get_cards()`).
+
+    Follows `Blackjack.play_round`: the player and dealer get two cards
+    each, the player hits while under the threshold, then the dealer
+    hits while under 17, and the round is settled by `Blackjack.outcome`
+    (so both busting is a tie). A hand stops drawing when the cards run
+    out. The EV is in units of the bet.
+
+    Compositions are packed into integers by `DealerOdds.pack`, and every
+    cache key is a single integer.
+
+    >>> from card import Card
+    >>> from deck import Deck
+    >>> half_deck = Deck().get_cards()[::2]
+    >>> solver = Solver(half_deck)
+    >>> round(solver.ev(17), 4)
+    0.0723
+    >>> evs = solver.evs()
+    >>> max(evs, key = evs.get)
+    18
+
+    # Only 7s and ten-valued cards: the player always stands on 17 or 20
+    >>> cards = Deck().get_cards()
+    >>> sevens_and_tens = [c for c in cards if c.value in (7, 10)][:8]
+    >>> abs(Solver(sevens_and_tens).ev(17)) < 1e-12
+    True
+
+    # Late in a deck the player can run out of cards, but never draws
+    # the dealer's hole card
+    >>> late = [Card(3, "clubs"), Card(3, "spades"), Card(4, "clubs"),\\
+    ... Card(6, "clubs"), Card(9, "spades"), Card("J", "clubs"),\\
+    ... Card("A", "clubs")]
+    >>> round(Solver(late).ev(21), 4)
+    -0.4429
+
+    # Dealer distributions stay on the Solver, and are freed with it
+    >>> all(key < 0 for key in DealerOdds.cache)
+    True
+    """
+
+    # Class Attribute(s)
+    bust = 22
+    # Maps a player's score to its `results`
+    result_cache = {}
+
+    def __init__(self, cards):
+        self.counts = DealerOdds.counts(cards)
+        self.packed = DealerOdds.pack(self.counts)
+        self.total = len(cards)
+        self.player_cache = {}
+        self.stand_cache = {}
+        # Dealer distributions by `DealerOdds.key`, see
+        # `DealerOdds.finals_packed`
+        self.dealer_cache = {}
+
+    def stand(self, score, upcard, hole, packed, total):
+        """
+        Returns the EV of standing on `score` against the dealer's
+        `upcard` and `hole` card, with the dealer's hits drawn from
+        `packed`.
+        """
+        key = (packed << 14) | (score << 8) | (hole << 4) | upcard
+        if key not in self.stand_cache:
+            odds = DealerOdds.finals_packed(upcard + hole,\
+            int(upcard == 1) + int(hole == 1), packed, total,\
+            self.dealer_cache)
+            self.stand_cache[key] = sum([p * result for p, result\
+            in zip(odds, Solver.results(score))])
+        return self.stand_cache[key]
+
+    def results(score):
+        """
+        Returns the results of standing on `score` against each final
+        score in `DealerOdds.finals_order`.
+        """
+        if score not in Solver.result_cache:
+            Solver.result_cache[score] = tuple([Blackjack.outcome(score,\
+            Solver.bust if final == 'bust' else final)\
+            for final in DealerOdds.finals_order])
+        return Solver.result_cache[score]
+
+    def player(self, stand_threshold, hard_total, aces, upcard, hole, packed,
+               total):
+        """
+        Returns the EV of a player hand that keeps hitting from `packed`
+        while it scores under `stand_threshold`.
+        """
+        score = PlayerHand.best_score(hard_total, aces)
+        if (score >= stand_threshold) | (total == 0):
+            return Solver.stand(self, score, upcard, hole, packed, total)
+        key = (packed << 22) | (stand_threshold << 16) | (hard_total << 10)\
+        | (min(aces, 2) << 8) | (hole << 4) | upcard
+        if key not in self.player_cache:
+            self.player_cache[key] = sum([p * Solver.player(self,\
+            stand_threshold, hard_total + value, aces + (value == 1),\
+            upcard, hole, left, total - 1)\
+            for value, p, left in DealerOdds.draws(packed, total)])
+        return self.player_cache[key]
+
+    def ev(self, stand_threshold):
+        """
+        Returns the exact EV of one round with the given stand threshold.
+        """
+        assert isinstance(stand_threshold, int)
+        ev = 0
+        total = self.total
+        for first, p1, left1 in DealerOdds.draws(self.packed, total):
+            for upcard, p2, left2 in DealerOdds.draws(left1, total - 1):
+                for second, p3, left3 in DealerOdds.draws(left2, total - 2):
+                    # The hole card is dealt before the player hits, so
+                    # the player can never draw it, even when the cards
+                    # run out.
+                    for hole, p4, left4 in DealerOdds.draws(left3,\
+                    total - 3):
+                        ev += p1 * p2 * p3 * p4 * Solver.player(self,\
+                        stand_threshold, first + second,\
+                        (first == 1) + (second == 1), upcard, hole, left4,\
+                        total - 4)
+        return ev
+
+    def evs(self, thresholds=range(12, 22)):
+        """
+        Returns a dictionary mapping each stand threshold to its EV.
+        """
+        return {t: Solver.ev(self, t) for t in thresholds}
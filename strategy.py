@@ -0,0 +1,179 @@
+import numpy as np
+
+class Strategy:
+    """
+    Decides whether a hand hits. `Blackjack.play_round`,
+    `Simulation.play_round` and `MonteCarlo.evaluate` accept a strategy
+    wherever they accept a `stand_threshold`.
+
+    A subclass implements `hits`, which takes the score of each hand
+    (see `Blackjack.calculate_score`), whether it is soft (1 or 0, see
+    `PlayerHand.is_soft`) and the value of the dealer's upcard (1 for an
+    Ace, 10 for ten-valued cards). It is called with plain integers by
+    `hit` and with NumPy arrays by the batch simulators.
+
+    >>> from card import Card
+    >>> from hand import PlayerHand
+    >>> hand = PlayerHand()
+    >>> hand.add_card(Card(10, "clubs"), Card(3, "hearts"))
+    >>> basic = TableStrategy.basic()
+    >>> basic.hit(hand, Card(5, "spades")), basic.hit(hand, Card(9, "spades"))
+    (False, True)
+    >>> ThresholdStrategy(17).hit(hand, Card(5, "spades"))
+    True
+    >>> Strategy.of(17).stand_threshold, Strategy.of(basic) is basic
+    (17, True)
+    """
+
+    # Class Attribute(s)
+
+    def of(stand_threshold):
+        """
+        Returns `stand_threshold` as a strategy: integers become a
+        ThresholdStrategy, strategies are returned as they are.
+        """
+        if isinstance(stand_threshold, Strategy):
+            return stand_threshold
+        return ThresholdStrategy(stand_threshold)
+
+    def hit(self, hand, upcard):
+        """
+        Returns whether `hand` should take another card against the dealer
+        showing `upcard`.
+        """
+        return bool(self.hits(hand.score(), int(hand.is_soft()),\
+        upcard.value))
+
+
+class ThresholdStrategy(Strategy):
+    """
+    Hits while the score is under `stand_threshold`, the rule
+    `Blackjack.hit_or_stand` has always used.
+    """
+
+    def __init__(self, stand_threshold):
+        assert isinstance(stand_threshold, int)
+        self.stand_threshold = stand_threshold
+
+    def hits(self, score, soft, upcard):
+        return score < self.stand_threshold
+
+    def hit(self, hand, upcard):
+        return hand.score() < self.stand_threshold
+
+
+class TableStrategy(Strategy):
+    """
+    Looks every decision up in a boolean array indexed by (score, soft,
+    upcard value - 1), so a decision is a single lookup whether it is
+    made for one hand or for a whole batch.
+
+    Scores go up to 32: a hard 22 scores 12 (see
+    `Blackjack.calculate_score`), so it can still hit up to 32. Hands
+    over 21 never hit, whatever the table says.
+
+    Tables are saved as fixed-size records of packed bits (83 bytes
+    each), so a file can hold thousands of candidate tables.
+
+    >>> from tempfile import TemporaryDirectory
+    >>> candidates = [TableStrategy.from_threshold(t) for t in (15, 16, 17)]
+    >>> candidates.append(TableStrategy.basic())
+    >>> folder = TemporaryDirectory()
+    >>> name = folder.name + "/strategies.bin"
+    >>> TableStrategy.save(name, [s.table for s in candidates])
+    >>> len(open(name, 'rb').read())
+    332
+    >>> tables = TableStrategy.load_all(name)
+    >>> tables.shape
+    (4, 33, 2, 10)
+    >>> bool((tables[3] == candidates[3].table).all())
+    True
+    >>> loaded = TableStrategy.load(name, 1)
+    >>> bool(loaded.hits(15, 0, 10)), bool(loaded.hits(16, 0, 10))
+    (True, False)
+    >>> folder.cleanup()
+
+    # A table built from a threshold plays exactly like the threshold
+    >>> from blackjack import Blackjack
+    >>> plain, table = Blackjack(100, rng=4), Blackjack(100, rng=4)
+    >>> plain.play_round(20, 16)
+    >>> table.play_round(20, TableStrategy.from_threshold(16))
+    >>> plain.get_log() == table.get_log()
+    True
+    """
+
+    # Class Attribute(s)
+    shape = (33, 2, 10)
+    bits = 33 * 2 * 10
+    record_size = -(-bits // 8)
+
+    def __init__(self, table):
+        """
+        Parameters:
+            table: boolean array of shape `TableStrategy.shape`, True
+            where the hand should hit.
+        """
+        table = np.array(table, dtype = bool)
+        assert table.shape == TableStrategy.shape
+        table[22:] = False
+        self.table = table
+
+    def hits(self, score, soft, upcard):
+        return self.table[score, soft, upcard - 1]
+
+    def hit(self, hand, upcard):
+        return bool(self.table[hand.score(), int(hand.is_soft()),\
+        upcard.value - 1])
+
+    def from_threshold(stand_threshold):
+        """
+        Returns the table of `ThresholdStrategy(stand_threshold)`.
+        """
+        table = np.zeros(TableStrategy.shape, dtype = bool)
+        table[:stand_threshold] = True
+        return TableStrategy(table)
+
+    def basic():
+        """
+        Returns the usual hit/stand basic strategy: hit hard 11 or less,
+        hard 12 against 2, 3 and 7 to Ace, hard 13 to 16 against 7 to Ace,
+        soft 17 or less, and soft 18 against 9, 10 and Ace.
+        """
+        table = np.zeros(TableStrategy.shape, dtype = bool)
+        # Upcard columns: Ace, 2, ..., 9, ten-valued
+        table[:12, 0] = True
+        table[12, 0, [0, 1, 2, 6, 7, 8, 9]] = True
+        table[13:17, 0, [0, 6, 7, 8, 9]] = True
+        table[:18, 1] = True
+        table[18, 1, [0, 8, 9]] = True
+        return TableStrategy(table)
+
+    def save(path, tables):
+        """
+        Writes a sequence of tables to `path`, one packed record each.
+        """
+        tables = np.array(tables, dtype = bool)
+        assert tables.shape[1:] == TableStrategy.shape
+        np.packbits(tables.reshape(len(tables), -1), axis = 1).tofile(path)
+
+    def load_all(path):
+        """
+        Returns every table in a file written by `save` as one boolean
+        array of shape (tables, 33, 2, 10).
+        """
+        packed = np.fromfile(path, dtype = np.uint8)
+        packed = packed.reshape(-1, TableStrategy.record_size)
+        return np.unpackbits(packed, axis = 1, count = TableStrategy.bits)\
+        .astype(bool).reshape((-1,) + TableStrategy.shape)
+
+    def load(path, index=0):
+        """
+        Returns the table at `index` in a file written by `save` as a
+        strategy, reading only that record.
+        """
+        size = TableStrategy.record_size
+        packed = np.fromfile(path, dtype = np.uint8, count = size,\
+        offset = index * size)
+        assert len(packed) == size
+        return TableStrategy(np.unpackbits(packed,\
+        count = TableStrategy.bits).astype(bool).reshape(TableStrategy.shape))
@@ -0,0 +1,135 @@
+from os import devnull
+from time import monotonic
+
+class SummaryWriter:
+    """
+    Buffered writer for game summary files. Keeps one file handle open and
+    holds finished rounds in memory, writing them out once `buffer_size`
+    characters are waiting, once `max_seconds` have passed since the last
+    write, and when the writer is flushed, closed or used as a context
+    manager that exits.
+
+    >>> from os import path
+    >>> from tempfile import TemporaryDirectory
+    >>> from card import Card
+    >>> from hand import PlayerHand, DealerHand
+    >>> player, dealer = PlayerHand(), DealerHand()
+    >>> player.add_card(Card("A", "spades"), Card("K", "hearts"))
+    >>> dealer.add_card(Card(9, "clubs"))
+    >>> with TemporaryDirectory() as folder:
+    ...     name = path.join(folder, "game_summary2.txt")
+    ...     with SummaryWriter(name) as writer:
+    ...         writer.write_round(1, player, dealer, 'Player')
+    ...         path.exists(name)
+    ...     print(open(name, encoding = 'utf-8').read(), end = '')
+    False
+    ROUND 1:
+    Player Hand:
+    ____
+    |K  |
+    | ♥ |
+    |__K|
+    ____
+    |A  |
+    | ♠ |
+    |__A|
+    Dealer Hand:
+    ____
+    |9  |
+    | ♣ |
+    |__9|
+    Winner of ROUND 1: Player
+    <BLANKLINE>
+    """
+
+    # Class Attribute(s)
+
+    def __init__(self, path, buffer_size=65536, max_seconds=None):
+        """
+        Parameters:
+            path (str): Summary file to append to. It is only created once
+            something is written to it.
+            buffer_size (int): Number of buffered characters that triggers
+            a write.
+            max_seconds (float): Longest time rounds stay buffered before
+            the next round triggers a write. None disables the timer.
+        """
+        self.path = path
+        self.buffer_size = buffer_size
+        self.max_seconds = max_seconds
+        self.file = None
+        self.buffer = []
+        self.buffered = 0
+        self.last_flush = monotonic()
+
+    def format_round(round_number, player_hand, dealer_hand, result):
+        """
+        Returns the summary text of one round, as written by
+        `Blackjack.add_to_file`.
+        """
+        return 'ROUND {0}:\nPlayer Hand:\n{1}\n'\
+        .format(round_number, player_hand) +\
+        'Dealer Hand:\n{0}\n'.format(dealer_hand) +\
+        'Winner of ROUND {0}: {1}\n\n'.format(round_number, result)
+
+    def write_round(self, round_number, player_hand, dealer_hand, result,
+                    wallet=None, bet=None):
+        """
+        Buffers the summary of one round. `wallet` and `bet` are accepted
+        for compatibility with RecordWriter and not written.
+        """
+        self.write(SummaryWriter.format_round(round_number, player_hand,\
+        dealer_hand, result))
+
+    def write(self, text):
+        self.buffer.append(text)
+        self.buffered += len(text)
+        if self.buffered >= self.buffer_size:
+            self.flush()
+        elif (self.max_seconds is not None) and \
+        (monotonic() - self.last_flush >= self.max_seconds):
+            self.flush()
+
+    def flush(self):
+        """
+        Writes every buffered round to the file.
+        """
+        if self.buffer:
+            if self.file is None:
+                self.file = open(self.path, 'a', encoding = 'utf-8')
+            self.file.write(''.join(self.buffer))
+            self.file.flush()
+            self.buffer = []
+            self.buffered = 0
+        self.last_flush = monotonic()
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class NullWriter(SummaryWriter):
+    """
+    Writer that drops every round without formatting it, for games such
+    as Simulation that keep no summary.
+
+    >>> writer = NullWriter()
+    >>> writer.write_round(1, None, None, 'Player')
+    >>> writer.buffer, writer.path == devnull
+    ([], True)
+    """
+
+    def __init__(self, path=devnull, buffer_size=65536, max_seconds=None):
+        SummaryWriter.__init__(self, path, buffer_size, max_seconds)
+
+    def write_round(self, round_number, player_hand, dealer_hand, result,
+                    wallet=None, bet=None):
+        pass
@@ -0,0 +1,113 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from deck import Deck, Shoe
+from simulation import Simulation
+
+from numpy.random import SeedSequence, default_rng
+
+class Tournament:
+    """
+    Runs many (wallet, stand_threshold) configurations across worker
+    processes and merges their outcome statistics.
+
+    Every game gets its own random stream spawned from `root_seed` by its
+    position in the job list, so the results do not depend on how many
+    workers run them or in which order they finish.
+
+    >>> tournament = Tournament(50, root_seed=1234, num_decks=2)
+    >>> configs = [(100, 15), (100, 17)]
+    >>> serial = tournament.run(configs, repeats=3, workers=1)
+    >>> parallel = tournament.run(configs, repeats=3, workers=2)
+    >>> serial == parallel
+    True
+    >>> stats = serial[(100, 17)]
+    >>> stats['games']
+    3
+    >>> stats['wins'] + stats['ties'] + stats['losses'] == stats['rounds']
+    True
+    >>> Tournament(50, root_seed=99, num_decks=2).run(configs, workers=1) \\
+    ... == Tournament(50, root_seed=1234, num_decks=2).run(configs, workers=1)
+    False
+    """
+
+    # Class Attribute(s)
+
+    def __init__(self, num_rounds, root_seed=0, num_decks=None):
+        """
+        Parameters:
+            num_rounds (int): Rounds played per game.
+            root_seed (int): Seed all of the game streams are derived from.
+            num_decks (int): Play from a Shoe of this many decks. By
+            default every game uses a single Deck.
+        """
+        assert isinstance(num_rounds, int)
+        self.num_rounds = num_rounds
+        self.root_seed = root_seed
+        self.num_decks = num_decks
+
+    def play(job):
+        """
+        Plays a single game in a worker process.
+
+        Parameters:
+            job: tuple of (wallet, stand_threshold, num_rounds, num_decks,
+            seed_sequence).
+        Returns:
+            A tuple of (rounds, wins, ties, losses, final wallet, status).
+        """
+        wallet, stand_threshold, num_rounds, num_decks, seed_sequence = job
+        if num_decks is None:
+            deck = Deck()
+        else:
+            deck = Shoe(num_decks)
+        game = Simulation(wallet, deck, default_rng(seed_sequence))
+        results = game.play_round(num_rounds, stand_threshold)['result']
+        return (len(results), int((results == 1).sum()),\
+        int((results == 0).sum()), int((results == -1).sum()),\
+        game.wallet, game.status)
+
+    def run(self, configs, repeats=1, workers=None):
+        """
+        Plays `repeats` games of every (wallet, stand_threshold) config.
+
+        Parameters:
+            configs: list of (wallet, stand_threshold) tuples.
+            repeats (int): Number of independent games per config.
+            workers (int): Number of worker processes. 1 plays every game
+            in this process; None lets the executor decide.
+        Returns:
+            A dictionary mapping each config to its merged statistics:
+            games, rounds, wins, ties, losses, wallet_change (summed over
+            games), final_wallets (in game order) and statuses.
+        """
+        assert isinstance(repeats, int)
+        configs = [tuple(config) for config in configs]
+        streams = SeedSequence(self.root_seed)\
+        .spawn(len(configs) * repeats)
+        jobs = [(wallet, threshold, self.num_rounds, self.num_decks,\
+        streams[i * repeats + j])\
+        for i, (wallet, threshold) in enumerate(configs)\
+        for j in range(repeats)]
+
+        if workers == 1:
+            outcomes = list(map(Tournament.play, jobs))
+        else:
+            with ProcessPoolExecutor(max_workers = workers) as executor:
+                outcomes = list(executor.map(Tournament.play, jobs,\
+                chunksize = max(1, len(jobs) // 64)))
+
+        merged = {}
+        for (wallet, threshold, *rest), outcome in zip(jobs, outcomes):
+            rounds, wins, ties, losses, final_wallet, status = outcome
+            stats = merged.setdefault((wallet, threshold),\
+            {'games': 0, 'rounds': 0, 'wins': 0, 'ties': 0, 'losses': 0,\
+            'wallet_change': 0, 'final_wallets': [], 'statuses': []})
+            stats['games'] += 1
+            stats['rounds'] += rounds
+            stats['wins'] += wins
+            stats['ties'] += ties
+            stats['losses'] += losses
+            stats['wallet_change'] += final_wallet - wallet
+            stats['final_wallets'].append(final_wallet)
+            stats['statuses'].append(status)
+        return merged